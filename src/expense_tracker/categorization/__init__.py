@@ -19,7 +19,14 @@ from expense_tracker.categorization.rules import (
     UserDefinedRule,
     DefaultRule
 )
-from expense_tracker.categorization import categories
+
+def __getattr__(name: str):
+    """Import the `categories` submodule on first access (PEP 562)."""
+    if name == "categories":
+        from expense_tracker.categorization import categories
+        return categories
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "CategorizationEngine",
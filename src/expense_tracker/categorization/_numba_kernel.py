@@ -0,0 +1,118 @@
+"""
+Numba-compiled keyword scan for large categorization batches.
+
+Descriptions and keywords are packed into flat uint8 buffers with offsets
+(one contiguous array each instead of a list of Python strings) so the
+substring search can run in nopython mode, in parallel across descriptions.
+
+Only keyword rules go through here - Numba can't run regexes, so regex
+rules stay on the pandas/CPython path.
+
+numba is optional. If it isn't installed `scan_keywords` is None and
+callers should use their regular matching path.
+"""
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+def pack_strings(strings: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack strings into one UTF-8 byte buffer plus offsets.
+
+    String `i` is `buffer[offsets[i]:offsets[i + 1]]`. Substring checks on
+    UTF-8 bytes give the same answer as on the original strings.
+
+    Args:
+        strings: Strings to pack
+
+    Returns:
+        (offsets, buffer) arrays
+    """
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    buffer = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return offsets, buffer
+
+
+if numba is not None:
+
+    @numba.njit(cache=True)
+    def _contains(haystack, h_start, h_end, needle, n_start, n_end):
+        """Naive byte-level substring search."""
+        n_len = n_end - n_start
+        if n_len == 0:
+            return False
+
+        first = needle[n_start]
+        for i in range(h_start, h_end - n_len + 1):
+            if haystack[i] != first:
+                continue
+
+            found = True
+            for j in range(1, n_len):
+                if haystack[i + j] != needle[n_start + j]:
+                    found = False
+                    break
+
+            if found:
+                return True
+
+        return False
+
+    @numba.njit(cache=True, parallel=True)
+    def _scan(desc_offsets, desc_bytes, kw_offsets, kw_bytes, kw_to_cat, out):
+        """
+        Write the best (lowest) category index matched by each description.
+
+        out[i] is left at -1 when no keyword is found in description i.
+        """
+        num_keywords = kw_offsets.shape[0] - 1
+        for i in numba.prange(desc_offsets.shape[0] - 1):
+            best = -1
+            for k in range(num_keywords):
+                category = kw_to_cat[k]
+                if best != -1 and category >= best:
+                    continue
+
+                if _contains(
+                    desc_bytes, desc_offsets[i], desc_offsets[i + 1],
+                    kw_bytes, kw_offsets[k], kw_offsets[k + 1]
+                ):
+                    best = category
+                    if best == 0:
+                        break
+
+            out[i] = best
+
+    def scan_keywords(
+        descriptions: List[str],
+        keywords: List[str],
+        keyword_categories: List[int]
+    ) -> np.ndarray:
+        """
+        Find the highest priority keyword category for each description.
+
+        Args:
+            descriptions: Lowercase descriptions
+            keywords: Lowercase keywords
+            keyword_categories: Category index (priority) of each keyword
+
+        Returns:
+            int64 array with a category index per description, -1 for no match
+        """
+        desc_offsets, desc_bytes = pack_strings(descriptions)
+        kw_offsets, kw_bytes = pack_strings(keywords)
+        kw_to_cat = np.asarray(keyword_categories, dtype=np.int64)
+
+        out = np.empty(len(descriptions), dtype=np.int64)
+        _scan(desc_offsets, desc_bytes, kw_offsets, kw_bytes, kw_to_cat, out)
+        return out
+
+else:
+    scan_keywords = None
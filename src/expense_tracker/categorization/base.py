@@ -1,7 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Iterable, List, Optional
 
 from expense_tracker.domain.models import Transaction
+from expense_tracker.domain.enums import TransactionType
+
+# Matches a description alone, returning a category or None
+DescriptionMatcher = Callable[[str], Optional[str]]
 
 class CategorizationRule(ABC):
     """
@@ -25,6 +29,8 @@ class CategorizationRule(ABC):
         ```
     """
 
+    __slots__ = ('_next_rule',)
+
     def __init__(self):
         self._next_rule: Optional['CategorizationRule'] = None
 
@@ -43,13 +49,61 @@ class CategorizationRule(ABC):
             `rule1.set_next(rule2).set_next(rule3)`
         """
         self._next_rule = rule
+        return rule
 
     @abstractmethod
+    def _try(self, transaction: Transaction) -> Optional[str]:
+        """
+        Try to categorize the transaction with this rule alone.
+
+        Subclasses implement their matching logic here, walking their
+        keywords/patterns once and returning the category of the first hit.
+
+        Args:
+            transaction: Transaction to categorize
+
+        Returns:
+            Category name, or None if this rule doesn't match
+        """
+        pass
+
+    def _try_many(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """
+        Batch version of _try().
+
+        Subclasses that can match many descriptions at once (e.g. with
+        vectorized string operations) override this. By default it calls
+        _try() on each transaction.
+
+        Args:
+            transactions: Transactions to categorize
+
+        Returns:
+            Category name (or None) for each transaction, in the same order
+        """
+        return [self._try(transaction) for transaction in transactions]
+
+    def _matchers_for(self, transaction_type: TransactionType) -> Optional[List[DescriptionMatcher]]:
+        """
+        Description-only matchers this rule runs for one transaction type.
+
+        Lets the engine flatten the whole chain into one list of calls per
+        type, with type filters and rule dispatch resolved up front.
+
+        Args:
+            transaction_type: Type of the transactions to be matched
+
+        Returns:
+            Matchers in priority order (empty if the rule never applies to
+            this type), or None if the rule needs the full transaction
+        """
+        return None
+
     def _matches(self, transaction: Transaction) -> bool:
         """
         Check if this rule matches the transaction.
 
-        Subclasses implement their specific matching logic here.
+        Kept for backwards compatibility, prefer _try().
 
         Args:
             transaction: Transaction to check
@@ -57,33 +111,36 @@ class CategorizationRule(ABC):
         Returns:
             True if this rule can categorize this transaction
         """
-        pass
+        return self._try(transaction) is not None
 
-
-    @abstractmethod
     def _get_category(self, transaction: Transaction) -> str:
         """
-        Get the category for the transaction
+        Get the category for the transaction.
 
-        Called only if _matches() returns True.
+        Kept for backwards compatibility, prefer _try().
 
         Args:
             transaction: Transaction to categorize
 
         Returns:
             Category name
-        """
-        pass
 
+        Raises:
+            RuntimeError: If this rule doesn't match the transaction
+        """
+        category = self._try(transaction)
+        if category is None:
+            raise RuntimeError("_get_category called but no match found")
+        return category
 
     def categorize(self, transaction: Transaction) -> Optional[str]:
         """
         Attempt to categorize a transaction.
 
         This is the main method called by clients. It:
-        1. Checks if a rule matches
-        2. If yes, returns the category
-        3. If no, tries the next rule in the chain
+        1. Tries this rule
+        2. If it matched, returns the category
+        3. If not, tries the next rule in the chain
 
         Args:
             Transaction to categorize.
@@ -91,12 +148,13 @@ class CategorizationRule(ABC):
         Returns:
             Category name, or None i no rules matched
         """
-        if self._matches(transaction):
-            return self._get_category(transaction)
-        
-        if self._next_rule:
-            return self._next_rule.categorize(transaction)
-        
+        # Walk the chain in a loop rather than recursing into each next rule
+        rule: Optional[CategorizationRule] = self
+        while rule is not None:
+            category = rule._try(transaction)
+            if category is not None:
+                return category
+            rule = rule._next_rule
 
         return None
     
@@ -104,7 +162,38 @@ class CategorizationRule(ABC):
         return f"{self.__class__.__name__}()"
 
 
+def try_rules_many(
+    rules: Iterable[CategorizationRule],
+    transactions: List[Transaction]
+) -> List[Optional[str]]:
+    """
+    Run a batch of transactions through rules in priority order.
+
+    Each rule only sees the transactions no earlier rule matched, via its
+    batch _try_many() method.
+
+    Args:
+        rules: Rules in priority order
+        transactions: Transactions to categorize
+
+    Returns:
+        Category name (or None if no rule matched) for each transaction
+    """
+    results: List[Optional[str]] = [None] * len(transactions)
+    remaining = list(range(len(transactions)))
 
+    for rule in rules:
+        if not remaining:
+            break
 
+        found = rule._try_many([transactions[i] for i in remaining])
 
+        unmatched = []
+        for i, category in zip(remaining, found):
+            if category is None:
+                unmatched.append(i)
+            else:
+                results[i] = category
+        remaining = unmatched
 
+    return results
@@ -1,3 +1,5 @@
+import sys
+
 # Expense Categories
 GROCERIES = "Groceries"
 FOOD_DINING = "Food & Dining"
@@ -22,7 +24,7 @@ CASHBACK = "Cashback"
 OTHER_INCOME = "Other Income"
 
 # Special
-UNCATEGORIZED = "Uncategorized"
+UNCATEGORIZED = sys.intern("Uncategorized")
 
 # Collections for validation
 EXPENSE_CATEGORIES = {
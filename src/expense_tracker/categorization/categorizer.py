@@ -1,8 +1,12 @@
-import json
+from dataclasses import replace
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-from expense_tracker.categorization.base import CategorizationRule
+from expense_tracker.categorization.base import (
+    CategorizationRule,
+    DescriptionMatcher,
+    try_rules_many
+)
 from expense_tracker.categorization.rules import (
     UserDefinedRule,
     KeywordRule,
@@ -11,7 +15,8 @@ from expense_tracker.categorization.rules import (
 )
 from expense_tracker.categorization.categories import UNCATEGORIZED
 from expense_tracker.domain.models import Transaction
-from expense_tracker.config.settings import ConfigLoader
+from expense_tracker.domain.enums import TransactionType
+from expense_tracker.config.settings import ConfigLoader, load_json
 
 class CategorizationEngine:
     """
@@ -51,9 +56,26 @@ class CategorizationEngine:
         """
         self.use_defaults = use_defaults
         self._rule_chain: Optional[CategorizationRule] = None
-        
-        # Build the rule chain
-        self._build_rule_chain(config)
+        self._rules: Tuple[CategorizationRule, ...] = ()
+        self._matchers: Optional[Dict[TransactionType, Tuple[DescriptionMatcher, ...]]] = None
+
+        # The rule chain is built on first use, so an engine that never
+        # categorizes anything doesn't read any rule config
+        self._pending_config = config
+        self._built = False
+
+    def _ensure_built(self) -> Tuple[CategorizationRule, ...]:
+        """
+        Build the rule chain if it hasn't been built yet.
+
+        Returns:
+            The rules in priority order
+        """
+        if not self._built:
+            self._build_rule_chain(self._pending_config)
+            self._pending_config = None
+            self._built = True
+        return self._rules
 
 
     def _load_user_rules_config(
@@ -82,22 +104,13 @@ class CategorizationEngine:
         """
         Load build-in default rules.
 
+        The file is read once at import time (see `_BUILTIN_RULES_CACHE`),
+        so building more engines doesn't hit the disk again.
+
         Returns:
             Config dictionaty with built-in rules
         """
-        # Built-in rules are always in the package config/defaults folder
-        builtin_path = Path(__file__).parent.parent / "config" / "defaults" / "rules.json"
-        
-        if not builtin_path.exists():
-            return {"rules": []}
-        
-        import json
-        try:
-            with open(builtin_path) as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Warning: Could not load built-in rules: {e}")
-            return {"rules": []}
+        return _BUILTIN_RULES_CACHE
         
     def _build_rule_chain(
         self,
@@ -129,10 +142,43 @@ class CategorizationEngine:
 
         rules.append(DefaultRule(UNCATEGORIZED))
 
-        if rules:
-            self._rule_chain = rules[0]
-            for i in range(len(rules) - 1):
-                rules[i].set_next(rules[i+1])
+        # Flat copy of the chain for iterating without hopping _next_rule
+        self._rules = tuple(rules)
+
+        self._rule_chain = rules[0]
+        for rule, next_rule in zip(rules, rules[1:]):
+            rule.set_next(next_rule)
+
+        self._matchers = self._specialize(self._rules)
+
+    @staticmethod
+    def _specialize(
+        rules: Tuple[CategorizationRule, ...]
+    ) -> Optional[Dict[TransactionType, Tuple[DescriptionMatcher, ...]]]:
+        """
+        Flatten the chain into one tuple of description matchers per type.
+
+        The chain never changes once built, so type filters and the rule to
+        rule dispatch can be resolved here. categorize() then only calls
+        matchers in priority order.
+
+        Args:
+            rules: Rules in priority order
+
+        Returns:
+            Matchers for each transaction type, or None if some rule can't
+            match on the description alone
+        """
+        specialized = {}
+        for transaction_type in TransactionType:
+            matchers: List[DescriptionMatcher] = []
+            for rule in rules:
+                rule_matchers = rule._matchers_for(transaction_type)
+                if rule_matchers is None:
+                    return None
+                matchers.extend(rule_matchers)
+            specialized[transaction_type] = tuple(matchers)
+        return specialized
 
     def categorize(self, transaction: Transaction) -> str:
         """
@@ -153,14 +199,24 @@ class CategorizationEngine:
             'Groceries'
             ```
         """
-        if not self._rule_chain:
+        rules = self._rules or self._ensure_built()
+        if not rules:
             raise RuntimeError("Rule chain not initialized")
-        
-        category = self._rule_chain.categorize(transaction)
 
-        assert category is not None, "Rule chain should never return None"
+        if self._matchers is not None:
+            description = transaction.description
+            for match in self._matchers[transaction.type]:
+                category = match(description)
+                if category is not None:
+                    return category
+            raise AssertionError("Rule chain should never return None")
+        
+        for rule in rules:
+            category = rule._try(transaction)
+            if category is not None:
+                return category
 
-        return category
+        raise AssertionError("Rule chain should never return None")
     
     def categorize_many(
         self,
@@ -169,6 +225,9 @@ class CategorizationEngine:
     ) -> List[Transaction]:
         """
         Categorize multiple transactions.
+
+        Transactions are matched in bulk: each rule runs over every pending
+        description at once rather than walking the chain per transaction.
         
         Args:
             transactions: List of transactions to categorize
@@ -183,26 +242,36 @@ class CategorizationEngine:
             >>> transactions = [txn1, txn2, txn3]
             >>> categorized = engine.categorize_many(transactions)
         """
-        categorized = []
+        rules = self._rules or self._ensure_built()
+        if not rules:
+            raise RuntimeError("Rule chain not initialized")
+
+        if overwrite:
+            pending = list(range(len(transactions)))
+        else:
+            uncategorized = UNCATEGORIZED
+            pending = [
+                i for i, txn in enumerate(transactions)
+                if not txn.category or txn.category == uncategorized
+            ]
+
+        if not pending:
+            # Re-runs over already categorized transactions skip the rules
+            return list(transactions)
 
-        for txn in transactions:
-            if not overwrite and txn.category and txn.category != UNCATEGORIZED:
-                categorized.append(txn)
-                continue
+        # Match all pending transactions together, one rule at a time
+        categories = try_rules_many(
+            rules,
+            [transactions[i] for i in pending]
+        )
 
-            category = self.categorize(txn)
+        # Full-size output up front: skipped rows are already in place and
+        # pending ones are written by index, so the list never grows
+        categorized = list(transactions)
+        for i, category in zip(pending, categories):
+            assert category is not None, "Rule chain should never return None"
 
-            categorized_txn = Transaction(
-                id=txn.id,
-                date=txn.date,
-                description=txn.description,
-                amount=txn.amount,
-                type=txn.type,
-                account=txn.account,
-                raw_data=txn.raw_data,
-                category=category
-            )
-            categorized.append(categorized_txn)
+            categorized[i] = replace(transactions[i], category=category)
 
         return categorized
 
@@ -215,29 +284,38 @@ class CategorizationEngine:
         Returns:
             String description of the current rule chain.
         """
-        if not self._rule_chain:
+        rules = self._ensure_built()
+        if not rules:
             return "No rules loaded"
         
-        rules = []
-        current = self._rule_chain
-        priority = 1
-
-        while current:
-            rules.append(f"{priority}. {current}")
-            current = current._next_rule
-            priority +=1
-
-        return "\n".join(rules)
+        return "\n".join(
+            f"{priority}. {rule}" for priority, rule in enumerate(rules, start=1)
+        )
     
 
     def __repr__(self) -> str:
-        num_rules = 0
-        current = self._rule_chain
-        while current:
-            num_rules+=1
-            current = current._next_rule
+        return f"CategorizationEngine({len(self._ensure_built())} rules in chain)"
 
-        return f"CategorizationEngine({num_rules} rules in chain)"
 
+def _load_builtin_rules_from_disk() -> Dict[str, Any]:
+    """
+    Read the built-in default rules shipped with the package.
 
-        
+    Returns:
+        Config dictionary with built-in rules, empty if they can't be loaded
+    """
+    # Built-in rules are always in the package config/defaults folder
+    builtin_path = Path(__file__).parent.parent / "config" / "defaults" / "rules.json"
+
+    if not builtin_path.exists():
+        return {"rules": []}
+
+    try:
+        return load_json(builtin_path)
+    except Exception as e:
+        print(f"Warning: Could not load built-in rules: {e}")
+        return {"rules": []}
+
+
+# Built-in rules never change at runtime, so load them once per process
+_BUILTIN_RULES_CACHE: Dict[str, Any] = _load_builtin_rules_from_disk()
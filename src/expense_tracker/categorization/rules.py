@@ -1,10 +1,120 @@
 import re
-from typing import Dict, List, Optional
+import sys
+import warnings
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 
-from expense_tracker.categorization.base import CategorizationRule
+from expense_tracker.categorization.base import (
+    CategorizationRule,
+    DescriptionMatcher,
+    try_rules_many
+)
 from expense_tracker.domain.models import Transaction
 from expense_tracker.domain.enums import TransactionType
 
+try:
+    import ahocorasick
+except ImportError:
+    # Optional dependency - KeywordRule falls back to plain substring checks
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    # Optional dependency - RegexRule falls back to the combined `re` pattern
+    re2 = None
+
+# Lowercases ASCII and drops punctuation that keyword matching ignores, in
+# one str.translate pass
+_FOLD = str.maketrans({
+    **{code: code + 32 for code in range(ord("A"), ord("Z") + 1)},
+    **{ord(char): None for char in "*#-_/"},
+})
+
+@lru_cache(maxsize=1024)
+def _normalized(text: str) -> str:
+    """
+    Normalize a description or keyword for keyword matching, memoized.
+
+    Every keyword rule in the chain needs the normalized description; caching
+    it means a transaction is normalized once no matter how many rules see it.
+    Keywords go through the same function so both sides agree.
+    """
+    folded = text.translate(_FOLD)
+    # The table only folds ASCII, anything else still needs a full lower()
+    return folded if text.isascii() else folded.lower()
+
+def _vectorized_match(
+    transactions: List[Transaction],
+    category_patterns: List[Tuple[str, "re.Pattern"]],
+    transaction_type: Optional[TransactionType] = None,
+    normalize: bool = False
+) -> List[Optional[str]]:
+    """
+    Categorize a batch of descriptions with pandas string operations.
+
+    Runs one `str.contains` per category across every description, in
+    priority order, only assigning categories to rows not matched yet.
+
+    Args:
+        transactions: Transactions to categorize
+        category_patterns: (category, compiled pattern) pairs in priority order
+        transaction_type: Optional filter for DEBIT or CREDIT only
+        normalize: Match against normalized descriptions (see `_normalized`)
+
+    Returns:
+        Category name (or None) for each transaction
+    """
+    # Imported here so categorizing a single transaction doesn't pay for pandas
+    import numpy as np
+    import pandas as pd
+
+    results = np.full(len(transactions), None, dtype=object)
+    pending = np.fromiter(
+        (transaction_type is None or txn.type is transaction_type for txn in transactions),
+        dtype=bool,
+        count=len(transactions)
+    )
+    descriptions = pd.Series(
+        [_normalized(txn.description) if normalize else txn.description for txn in transactions],
+        dtype=object
+    )
+
+    for category, pattern in category_patterns:
+        if not pending.any():
+            break
+
+        with warnings.catch_warnings():
+            # User regexes may contain capture groups, which pandas warns about
+            warnings.simplefilter("ignore", UserWarning)
+            matched = descriptions.str.contains(pattern, regex=True, na=False).to_numpy(dtype=bool)
+
+        mask = pending & matched
+        results[mask] = category
+        pending &= ~mask
+
+    return results.tolist()
+
+# Categories mapped to their keywords/patterns, in priority order. A list of
+# pairs lets the same category appear more than once.
+CategoryMap = Union[Dict[str, List[str]], Sequence[Tuple[str, List[str]]]]
+
+def _category_entries(category_map: CategoryMap) -> List[Tuple[str, List[str]]]:
+    """
+    Return (category, patterns) pairs in priority order.
+
+    Category names are interned so every categorized transaction shares
+    one string per category.
+    """
+    items = category_map.items() if isinstance(category_map, dict) else category_map
+    return [(sys.intern(category), list(patterns)) for category, patterns in items]
+
+# Batches at least this big use the Numba keyword scan when numba is installed
+_NUMBA_THRESHOLD = 500
+
+# Numbered/named backreferences can't survive being merged into one pattern
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
 
 class KeywordRule(CategorizationRule):
     """
@@ -12,7 +122,7 @@ class KeywordRule(CategorizationRule):
     
     
     Features:
-    - Case-insensitive matching
+    - Case-insensitive matching, ignoring `*#-_/` punctuation
     - Can match multiple keywords per category
     - Can be transaction-type specific (debit vs credit)
 
@@ -27,7 +137,7 @@ class KeywordRule(CategorizationRule):
 
     def __init__(
             self,
-            keyword_map: Dict[str, List[str]],
+            keyword_map: CategoryMap,
             transaction_type: Optional[TransactionType] = None
         ):
         """
@@ -35,46 +145,144 @@ class KeywordRule(CategorizationRule):
         
         Args:
             keyword_map: Dict mapping categories to list of keywords.
-                Example: `{"Groceries": ["loblaws", "metro", "walmart"]}`
+                Example: `{"Groceries": ["loblaws", "metro", "walmart"]}`.
+                A list of (category, keywords) pairs is also accepted.
             transaction_type: Optional filter for DEBIT or CREDIT only
         """
         super().__init__()
         self.keyword_map = keyword_map
         self.transaction_type = transaction_type
         
-        # Pre-process keywords to lowercase for case-insensitive matching
-        self._normalized_map: Dict[str, List[str]] = {}
-        for category, keywords in keyword_map.items():
-            self._normalized_map[category] = [kw.lower() for kw in keywords]
+        # Pre-process keywords the same way descriptions are normalized,
+        # dropping duplicates and putting longer (more specific) ones first
+        self._normalized_entries: List[Tuple[str, List[str]]] = [
+            (category, sorted({_normalized(kw) for kw in keywords}, key=lambda kw: (-len(kw), kw)))
+            for category, keywords in _category_entries(keyword_map)
+        ]
+
+        # Keyword -> (priority, category), priority being the category's position
+        self._kw_to_cat: Dict[str, Tuple[int, str]] = {}
+        for priority, (category, keywords) in enumerate(self._normalized_entries):
+            for keyword in keywords:
+                # First category wins when a keyword is listed more than once
+                if keyword and keyword not in self._kw_to_cat:
+                    self._kw_to_cat[keyword] = (priority, category)
+
+        self._automaton = self._build_automaton()
+        self._combined = self._build_combined_pattern()
+
+        # One pattern per category for batch matching in _try_many()
+        self._category_patterns: List[Tuple[str, re.Pattern]] = [
+            (category, re.compile("|".join(re.escape(kw) for kw in keywords if kw)))
+            for category, keywords in self._normalized_entries
+            if any(keywords)
+        ]
 
+    def _build_automaton(self):
+        """
+        Build an Aho-Corasick automaton over every keyword.
+
+        Returns:
+            The automaton, or None if pyahocorasick isn't installed
+        """
+        if ahocorasick is None or not self._kw_to_cat:
+            return None
+
+        automaton = ahocorasick.Automaton()
+        for keyword, payload in self._kw_to_cat.items():
+            automaton.add_word(keyword, payload)
+
+        automaton.make_automaton()
+        return automaton
+
+    def _build_combined_pattern(self) -> Optional[re.Pattern]:
+        """
+        Combine every keyword into one regex alternation.
+
+        Used when pyahocorasick isn't installed. The alternation is wrapped
+        in a lookahead so every position is tried, and keywords are ordered
+        by priority so the first alternative to match at a position is the
+        one the nested keyword loop would have picked.
+
+        Returns:
+            The compiled pattern, or None if there are no keywords
+        """
+        if not self._kw_to_cat:
+            return None
+
+        alternation = "|".join(re.escape(keyword) for keyword in self._kw_to_cat)
+        return re.compile(f"(?=({alternation}))")
+
+    def _find(self, description: str) -> Optional[str]:
+        """
+        Find the category of the highest priority keyword in the description.
+
+        Args:
+            description: Transaction description
+
+        Returns:
+            Category name, or None if no keyword matched
+        """
+        if self._automaton is not None:
+            matches = (payload for _, payload in self._automaton.iter(_normalized(description)))
+        elif self._combined is not None:
+            matches = (
+                self._kw_to_cat[m.group(1)]
+                for m in self._combined.finditer(_normalized(description))
+            )
+        else:
+            return None
+
+        best = None
+        for priority, category in matches:
+            if best is None or priority < best[0]:
+                best = (priority, category)
+                if priority == 0:
+                    break
+
+        return best[1] if best else None
     
-    def _matches(self, transaction: Transaction) -> bool:
-        """Check if any keyword matches the description"""
+    def _try(self, transaction: Transaction) -> Optional[str]:
+        """Return the category of the first matching keyword."""
 
-        if self.transaction_type and transaction.type != self.transaction_type:
-            return False
+        if self.transaction_type and transaction.type is not self.transaction_type:
+            return None
         
-        description_lower = transaction.description.lower()
+        return self._find(transaction.description)
 
-        for _, keywords in self._normalized_map.items():
-            for keyword in keywords:
-                if keyword in description_lower:
-                    return True
-                
-        return False
-    
-    def _get_category(self, transaction: Transaction) -> str:
-        """Return the category for the matched keyword."""
+    def _matchers_for(self, transaction_type: TransactionType) -> List[DescriptionMatcher]:
+        """Match descriptions directly when the type filter allows it."""
+        if self.transaction_type and self.transaction_type != transaction_type:
+            return []
+        return [self._find]
 
-        description_lower = transaction.description.lower()
+    def _try_many(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Match every description at once, one category at a time."""
+        if len(transactions) >= _NUMBA_THRESHOLD and self._kw_to_cat:
+            # Imported here so numba (if installed) only loads for big batches
+            from expense_tracker.categorization._numba_kernel import scan_keywords
+            if scan_keywords is not None:
+                return self._try_many_compiled(transactions, scan_keywords)
 
-        for category, keywords in self._normalized_map.items():
-            for keyword in keywords:
-                if keyword in description_lower:
-                    return category
+        return _vectorized_match(
+            transactions, self._category_patterns, self.transaction_type, normalize=True
+        )
+
+    def _try_many_compiled(self, transactions: List[Transaction], scan_keywords) -> List[Optional[str]]:
+        """Match a large batch with the Numba keyword scan."""
+        categories = [category for category, _ in self._normalized_entries]
+        found = scan_keywords(
+            [_normalized(txn.description) for txn in transactions],
+            list(self._kw_to_cat),
+            [priority for priority, _ in self._kw_to_cat.values()]
+        )
 
-        # _matches must have made a whoopsie                
-        raise RuntimeError("_get_category called but no match found")
+        return [
+            categories[index]
+            if index >= 0 and (not self.transaction_type or txn.type is self.transaction_type)
+            else None
+            for txn, index in zip(transactions, found.tolist())
+        ]
     
     def __repr__(self):
         num_categories = len(self.keyword_map)
@@ -97,7 +305,7 @@ class RegexRule(CategorizationRule):
 
     def __init__(
         self,
-        pattern_map: Dict[str, List[str]],
+        pattern_map: CategoryMap,
         transaction_type: Optional[TransactionType] = None
     ):
         """
@@ -105,41 +313,160 @@ class RegexRule(CategorizationRule):
         
         Args:
             pattern_map: Dict mapping categories to regex patterns
-                Example: {"Shopping": [r"^AMZN.*", r"AMAZON"]}
+                Example: {"Shopping": [r"^AMZN.*", r"AMAZON"]}.
+                A list of (category, patterns) pairs is also accepted.
             transaction_type: Optional filter for DEBIT or CREDIT only
         """
         super().__init__()
         self.pattern_map = pattern_map
         self.transaction_type = transaction_type
 
-        self._compiled_patterns: Dict[str, List[re.Pattern]] = {}
-        for category, patterns in pattern_map.items():
-            self._compiled_patterns[category] = [
-                re.compile(pattern, re.IGNORECASE) for pattern in patterns
-            ]
+        self._entries = _category_entries(pattern_map)
 
-    def _matches(self, transaction: Transaction) -> bool:
-        """Check if any pattern matches the description"""
+        self._compiled_patterns: List[Tuple[str, List[re.Pattern]]] = [
+            (category, [re.compile(pattern, re.IGNORECASE) for pattern in patterns])
+            for category, patterns in self._entries
+        ]
 
-        if self.transaction_type and self.transaction_type != transaction.type:
-            return False
-        
-        for _, patterns in self._compiled_patterns.items():
+        # One pattern per category for batch matching in _try_many()
+        self._category_patterns: List[Tuple[str, re.Pattern]] = []
+        for category, patterns in self._entries:
+            if patterns:
+                self._category_patterns.append((
+                    category,
+                    re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+                ))
+
+        # Named group -> (priority, category) for the combined pattern
+        self._group_to_cat: Dict[str, Tuple[int, str]] = {}
+        self._combined = self._build_combined_pattern()
+
+        # RE2 set index -> (priority, category)
+        self._set_index_to_cat: List[Tuple[int, str]] = []
+        self._pattern_set = self._build_pattern_set()
+
+    def _build_pattern_set(self):
+        """
+        Compile every pattern into one RE2 multi-pattern set.
+
+        RE2 matches in linear time, so a pathological user pattern can't
+        backtrack forever, and one scan reports every pattern that matched.
+
+        Returns:
+            The compiled set, or None if google-re2 isn't installed or a
+            pattern uses syntax RE2 doesn't support (e.g. backreferences)
+        """
+        if re2 is None:
+            return None
+
+        options = re2.Options()
+        options.case_sensitive = False
+        options.log_errors = False
+        pattern_set = re2.Set.SearchSet(options)
+
+        for priority, (category, patterns) in enumerate(self._entries):
             for pattern in patterns:
-                if pattern.search(transaction.description):
-                    return True
-                
-        return False
-    
-    def _get_category(self, transaction: Transaction) -> str:
-        """Return the category for the matched pattern"""
+                try:
+                    pattern_set.Add(pattern)
+                except re2.error:
+                    return None
+                self._set_index_to_cat.append((priority, category))
+
+        if not self._set_index_to_cat:
+            return None
+
+        pattern_set.Compile()
+        return pattern_set
+
+    def _build_combined_pattern(self) -> Optional[re.Pattern]:
+        """
+        Merge every pattern into one regex with a named group per category.
+
+        A single search then reports both whether anything matched and which
+        category it was (via `lastgroup`). The alternation sits in a lookahead
+        so every position is tried and the highest priority category can be
+        picked, same as looping over the patterns in order.
 
-        for category, patterns in self._compiled_patterns.items():
+        Returns:
+            The compiled pattern, or None if the patterns can't be merged
+            (e.g. they use backreferences or clashing group names)
+        """
+        parts = []
+        for priority, (category, patterns) in enumerate(self._entries):
+            if not patterns:
+                continue
+
+            if any(_BACKREFERENCE.search(pattern) for pattern in patterns):
+                return None
+
+            group = f"cat{priority}"
+            self._group_to_cat[group] = (priority, category)
+            alternation = "|".join(f"(?:{pattern})" for pattern in patterns)
+            parts.append(f"(?P<{group}>{alternation})")
+
+        if not parts:
+            return None
+
+        try:
+            return re.compile(f"(?=(?:{'|'.join(parts)}))", re.IGNORECASE)
+        except re.error:
+            return None
+
+    def _find(self, description: str) -> Optional[str]:
+        """
+        Find the category of the highest priority pattern in the description.
+
+        Args:
+            description: Transaction description
+
+        Returns:
+            Category name, or None if no pattern matched
+        """
+        if self._pattern_set is not None:
+            hits = self._pattern_set.Match(description)
+            if not hits:
+                return None
+            return min(self._set_index_to_cat[index] for index in hits)[1]
+
+        if self._combined is not None:
+            best = None
+            for match in self._combined.finditer(description):
+                priority, category = self._group_to_cat[match.lastgroup]
+                if best is None or priority < best[0]:
+                    best = (priority, category)
+                    if priority == 0:
+                        break
+            return best[1] if best else None
+        
+        for category, patterns in self._compiled_patterns:
             for pattern in patterns:
-                if pattern.search(transaction.description):
+                if pattern.search(description):
                     return category
-        
-        raise RuntimeError("_get_category called but no match found")
+        return None
+
+    def _try(self, transaction: Transaction) -> Optional[str]:
+        """Return the category of the first matching pattern"""
+
+        if self.transaction_type and self.transaction_type is not transaction.type:
+            return None
+
+        return self._find(transaction.description)
+                
+        return None
+
+    def _matchers_for(self, transaction_type: TransactionType) -> List[DescriptionMatcher]:
+        """Match descriptions directly when the type filter allows it."""
+        if self.transaction_type and self.transaction_type != transaction_type:
+            return []
+        return [self._find]
+
+    def _try_many(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Match every description at once, one category at a time."""
+        if self._combined is None:
+            # Patterns that can't be merged can't be batched either
+            return super()._try_many(transactions)
+
+        return _vectorized_match(transactions, self._category_patterns, self.transaction_type)
     
     def __repr__(self) -> str:
         num_categories = len(self.pattern_map)
@@ -186,9 +513,9 @@ class UserDefinedRule(CategorizationRule):
         """
         super().__init__()
         self.rules = rules_config
-        
-        self._keyword_rules: List[KeywordRule] = []
-        self._regex_rules: List[RegexRule] = []
+
+        keyword_entries: List[Tuple[str, List[str], Optional[TransactionType]]] = []
+        regex_entries: List[Tuple[str, List[str], Optional[TransactionType]]] = []
 
         for rule_def in self.rules:
             category = rule_def["category"]
@@ -200,39 +527,62 @@ class UserDefinedRule(CategorizationRule):
                 txn_type = TransactionType(rule_def["transaction_type"])
 
             if rule_type == "keyword":
-                self._keyword_rules.append(
-                    KeywordRule({category: patterns}, txn_type)
-                )
+                keyword_entries.append((category, patterns, txn_type))
             elif rule_type == "regex":
-                self._regex_rules.append(
-                    RegexRule({category: patterns}, txn_type)
-                )
-            
-    def _matches(self, transaction: Transaction) -> bool:
-        """Check if any user-defined rule matched."""
+                regex_entries.append((category, patterns, txn_type))
 
-        for rule in self._keyword_rules:
-            if rule._matches(transaction):
-                return True
-            
-        for rule in self._regex_rules:
-            if rule._matches(transaction):
-                return True
+        # Per transaction type, every applicable keyword rule merged into one
+        # KeywordRule (one automaton) and every regex rule into one RegexRule
+        # (one combined pattern), keeping config order as priority. Keyword
+        # rules are still tried before regex rules.
+        self._rules_by_type: Dict[TransactionType, List[CategorizationRule]] = {}
+        for txn_type in TransactionType:
+            keywords = [
+                (category, patterns) for category, patterns, rule_txn_type in keyword_entries
+                if rule_txn_type is None or rule_txn_type == txn_type
+            ]
+            regexes = [
+                (category, patterns) for category, patterns, rule_txn_type in regex_entries
+                if rule_txn_type is None or rule_txn_type == txn_type
+            ]
+
+            merged: List[CategorizationRule] = []
+            if keywords:
+                merged.append(KeywordRule(keywords))
+            if regexes:
+                merged.append(RegexRule(regexes))
+
+            self._rules_by_type[txn_type] = merged
             
-        return False
-    
-    def _get_category(self, transaction: Transaction) -> str:
-        "Get category from the fist matching rule"
-        
-        for rule in self._keyword_rules:
-            if rule._matches(transaction):
-                return rule._get_category(transaction)
+    def _try(self, transaction: Transaction) -> Optional[str]:
+        """Get category from the first matching user-defined rule."""
+
+        # Type filters were applied when merging, so match descriptions directly
+        for rule in self._rules_by_type[transaction.type]:
+            category = rule._find(transaction.description)
+            if category is not None:
+                return category
             
-        for rule in self._regex_rules:
-            if rule._matches(transaction):
-                return rule._get_category(transaction)
-                        
-        raise RuntimeError("_get_category called but no match found")
+        return None
+
+    def _matchers_for(self, transaction_type: TransactionType) -> List[DescriptionMatcher]:
+        """The merged rules for this type, already type filtered."""
+        return [rule._find for rule in self._rules_by_type[transaction_type]]
+
+    def _try_many(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Batch-match each transaction type through its merged rules."""
+        results: List[Optional[str]] = [None] * len(transactions)
+
+        for txn_type, rules in self._rules_by_type.items():
+            indices = [i for i, txn in enumerate(transactions) if txn.type is txn_type]
+            if not indices or not rules:
+                continue
+
+            found = try_rules_many(rules, [transactions[i] for i in indices])
+            for i, category in zip(indices, found):
+                results[i] = category
+
+        return results
 
 
     def __repr__(self) -> str:
@@ -255,15 +605,23 @@ class DefaultRule(CategorizationRule):
             default_category: The default category to return
         """
         super().__init__()
-        self.default_category = default_category
+        self.default_category = sys.intern(default_category)
 
-    def _matches(self, _: Transaction) -> bool:
-        """Always matches"""
-        return True
-    
-    def _get_category(self, _: Transaction) -> str:
-        """Only returns the default category."""
+    def _try(self, _: Transaction) -> Optional[str]:
+        """Always matches with the default category."""
         return self.default_category
 
+    def _find(self, _: str) -> str:
+        """Any description gets the default category."""
+        return self.default_category
+
+    def _matchers_for(self, transaction_type: TransactionType) -> List[DescriptionMatcher]:
+        """Always matches with the default category."""
+        return [self._find]
+
+    def _try_many(self, transactions: List[Transaction]) -> List[Optional[str]]:
+        """Every transaction gets the default category."""
+        return [self.default_category] * len(transactions)
+
     def __repr__(self) -> str:
         return f"DefaultRule('{self.default_category}')"
\ No newline at end of file
@@ -1,18 +1,14 @@
 import typer
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 from datetime import date
+from functools import lru_cache
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
-
-from expense_tracker.parsers.factory import ParserFactory
-from expense_tracker.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
-from expense_tracker.database.connection import DatabaseConfig, DatabaseManager
-from expense_tracker.services.transaction_service import TransactionService
-from expense_tracker.domain.enums import TransactionType
+# rich and the service stack are imported inside the commands that use them,
+# so `--help` doesn't pay for importing pandas, pdfplumber, sqlite, etc.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from expense_tracker.services.transaction_service import TransactionService
 
 app = typer.Typer(
     name="expense-tracker",
@@ -20,15 +16,38 @@ app = typer.Typer(
     add_completion=False,
 )
 
-console = Console()
+@lru_cache(maxsize=None)
+def _get_console() -> "Console":
+    """Create the shared rich console on first use."""
+    from rich.console import Console
+    return Console()
+
+# Amount cell templates, bound once instead of re-parsing an f-string per row
+_DEBIT_AMOUNT = "[red]-${:,.2f}[/red]".format
+_CREDIT_AMOUNT = "[green]+${:,.2f}[/green]".format
 
 class State:
     verbose: bool = False
-    service: Optional[TransactionService] = None
+    service: Optional["TransactionService"] = None
 
 
 state = State()
 
+def _get_service() -> "TransactionService":
+    """Build the transaction service (and everything under it) on first use."""
+    if state.service is None:
+        from expense_tracker.parsers.factory import ParserFactory
+        from expense_tracker.repositories.sqlite_transaction_repository import SQLiteTransactionRepository
+        from expense_tracker.database.connection import get_database_manager
+        from expense_tracker.services.transaction_service import TransactionService
+
+        ParserFactory.load_parsers_from_config()
+        db_manager = get_database_manager()
+        repository = SQLiteTransactionRepository(db_manager)
+        state.service = TransactionService(repository)
+
+    return state.service
+
 @app.callback()
 def main(
     verbose: bool = typer.Option(
@@ -40,13 +59,6 @@ def main(
     """
     Expense Tracker - Import, categorize, and analyze your expenses.
     """
-
-    if state.service is None:
-        ParserFactory.load_parsers_from_config()
-        db_manager = DatabaseManager(DatabaseConfig())
-        repository = SQLiteTransactionRepository(db_manager)
-        state.service = TransactionService(repository)
-
     state.verbose = verbose
 
 @app.command(name="import")
@@ -82,6 +94,13 @@ def import_transactions(
         expense-tracker import statement.xlsx --fi amex --dry-run
         expense-tracker import statement.xlsx --fi amex --categorize
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from expense_tracker.domain.enums import TransactionType
+
+    console = _get_console()
     try:
         console.print(Panel.fit(
             f"[bold cyan]Import Configuration[/bold cyan]\n"
@@ -99,7 +118,7 @@ def import_transactions(
         ) as progress:
             task = progress.add_task("Importing transactions...", total=None)
             
-            result = state.service.import_statement(
+            result = _get_service().import_statement(
                 filepath=filepath,
                 financial_institution=financial_institution,
                 dry_run=dry_run,
@@ -110,8 +129,7 @@ def import_transactions(
 
         console.print(f"\n[bold]Found {result.total_parsed} transactions[/bold]")
 
-        if result.imported or result.skipped:
-            preview_transactions = (result.imported + result.skipped)[:5]
+        if result.preview:
             preview_table = Table(title="Preview (first 5)")
             preview_table.add_column("Date", style="cyan")
             preview_table.add_column("Description", style="white")
@@ -119,9 +137,9 @@ def import_transactions(
             preview_table.add_column("Amount", justify="right")
             preview_table.add_column("Status", justify="center")
 
-            for txn in preview_transactions:
-                status = "[green]NEW[/green]" if txn in result.imported else "[yellow]DUP[/yellow]"
-                amount_color = "green" if txn.type.value == "Credit" else "red"
+            for txn, is_new in result.preview:
+                status = "[green]NEW[/green]" if is_new else "[yellow]DUP[/yellow]"
+                amount_color = "green" if txn.type is TransactionType.CREDIT else "red"
                 preview_table.add_row(
                     str(txn.date),
                     txn.description[:40],
@@ -171,6 +189,13 @@ def report(
         expense-tracker report
         expense-tracker report --month --year 2025
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+    from rich.table import Table
+
+    from expense_tracker.domain.enums import TransactionType
+
+    console = _get_console()
     try:
         if month is None:
             month = date.today().month
@@ -185,7 +210,7 @@ def report(
         ) as progress:
             task = progress.add_task("Generating report...", total=None)
             
-            summary = state.service.get_monthly_summary(
+            summary = _get_service().get_monthly_report(
                 year=year,
                 month=month
             )
@@ -239,8 +264,9 @@ def report(
             category_table.add_column("Amount", justify="right", style="red")
             category_table.add_column("% of Total", justify="right", style="dim")
             
+            total_debits = summary.total_debits
             for category, amount in summary.top_spending_categories[:10]:
-                percentage = (amount / summary.total_debits * 100) if summary.total_debits > 0 else 0
+                percentage = (amount / total_debits * 100) if total_debits > 0 else 0
                 category_table.add_row(
                     category,
                     f"${amount:,.2f}",
@@ -277,26 +303,21 @@ def report(
         
         console.print(f"\n[bold]Recent Transactions[/bold]")
         
-        all_transactions = summary.debits + summary.credits
-        all_transactions.sort(key=lambda t: t.date, reverse=True)
-        
         txn_table = Table(show_header=True, padding=(0, 1))
-        txn_table.add_column("Date", style="cyan", width=12)
+        txn_table.add_column("Date", style="cyan", width=12, no_wrap=True)
         txn_table.add_column("Description", style="white", max_width=40)
         txn_table.add_column("Category", style="dim", width=15)
         txn_table.add_column("Financial Institution", justify="right", width=12)
-        txn_table.add_column("Amount", justify="right", width=12)
+        txn_table.add_column("Amount", justify="right", width=12, no_wrap=True)
         
         # Show up to 15 most recent transactions
-        for txn in all_transactions[:15]:
+        for txn in summary.recent:
             # Truncate description if too long
             desc = txn.description[:37] + "..." if len(txn.description) > 40 else txn.description
             
             # Color amount based on type
-            if txn.type == TransactionType.DEBIT:
-                amount_str = f"[red]-${txn.amount:,.2f}[/red]"
-            else:
-                amount_str = f"[green]+${txn.amount:,.2f}[/green]"
+            format_amount = _DEBIT_AMOUNT if txn.type is TransactionType.DEBIT else _CREDIT_AMOUNT
+            amount_str = format_amount(txn.amount)
             
             txn_table.add_row(
                 str(txn.date),
@@ -309,8 +330,8 @@ def report(
         console.print(txn_table)
         
         # Footer with transaction count if we're showing a subset
-        if len(all_transactions) > 15:
-            console.print(f"\n[dim]Showing 15 of {len(all_transactions)} transactions[/dim]")
+        if summary.total_transactions > len(summary.recent):
+            console.print(f"\n[dim]Showing {len(summary.recent)} of {summary.total_transactions} transactions[/dim]")
         
         if state.verbose:
             console.print(f"\n[dim]→ Report generated successfully[/dim]")
@@ -366,9 +387,13 @@ def categorize_command(
         expense-tracker categorize --show-rules
     ```
     """
+    from rich.panel import Panel
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    console = _get_console()
     try:
         if show_rules:
-            engine = state.service.categorization_engine
+            engine = _get_service().categorization_engine
             console.print("\n[bold cyan]Active Categorization Rules [/bold cyan]\n")
             console.print(engine.get_rule_chain_info())
             console.print(f"\n[dim]Total rules in chain: {repr(engine)}[/dim]")
@@ -415,7 +440,7 @@ def categorize_command(
         ) as progress:
             task = progress.add_task("Categorizing transactions...", total=None)
 
-            count = state.service.categorize_transactions(
+            count = _get_service().categorize_transactions(
                 start_date=start,
                 end_date=end,
                 overwrite=overwrite
@@ -1,6 +1,14 @@
 from pathlib import Path
 import json
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Any
+
+try:
+    import orjson
+except ImportError:
+    # Optional dependency - fall back to the standard library decoder
+    orjson = None
 
 # Package defaults (bundled with code)
 PACKAGE_CONFIG_DIR = Path(__file__).parent / "defaults"
@@ -9,14 +17,36 @@ PACKAGE_CONFIG_DIR = Path(__file__).parent / "defaults"
 PROJECT_ROOT = Path(__file__).parent.parent.parent.parent
 USER_CONFIG_DIR = PROJECT_ROOT / "config"
 
+def load_json(path: Path) -> Any:
+    """
+    Read and parse a JSON file.
+
+    Decodes the raw bytes in one call, with orjson when it's installed.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON content
+    """
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 class ConfigLoader:
     """Load configuration with user overrides"""
 
     @staticmethod
-    def load_config(config_name: str) -> Dict[str, Any]:
+    @lru_cache(maxsize=None)
+    def load_config(config_name: str) -> Mapping[str, Any]:
         """
         Load config with fallback: user config -> default config
 
+        Each config is read and parsed once per process. The cached result
+        is returned as a read-only mapping so callers can't change it for
+        everyone else. Call `clear_cache()` to pick up edits.
+
         Args:
             config_name: Name of the config file (e.g., 'parsers.json')
 
@@ -27,14 +57,14 @@ class ConfigLoader:
             Parsed JSON configuration
         """
         user_config_path = USER_CONFIG_DIR / config_name
-        if user_config_path.exists():
-            with open(user_config_path) as f:
-                return json.load(f)
-            
         default_config_path = PACKAGE_CONFIG_DIR / config_name
-        if default_config_path.exists():
-            with open(default_config_path) as f:
-                return json.load(f)
+
+        # Opening directly instead of checking exists() first saves a stat
+        for config_path in (user_config_path, default_config_path):
+            try:
+                return MappingProxyType(load_json(config_path))
+            except FileNotFoundError:
+                continue
             
         raise FileNotFoundError(
             f"Config file '{config_name} not found in:\n"
@@ -43,6 +73,11 @@ class ConfigLoader:
         )
 
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget every loaded config, so the next load reads from disk"""
+        ConfigLoader.load_config.cache_clear()
+
     @staticmethod
     def load_parsers_config():
         """Load parsers registry configuration"""
@@ -1,7 +1,7 @@
 import sqlite3
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Any, Callable, Dict, Generator, Iterable, Optional, Sequence
 
 # Type alias for clarity
 Connection = sqlite3.Connection
@@ -31,6 +31,22 @@ def configure_connection(conn: Connection) -> None:
     """
     # Enable foreign key constraints (OFF by default in SQLite!)
     conn.execute("PRAGMA foreign_keys = ON")
+
+    # Write-ahead log: readers don't block the writer, and commits append
+    # to the log instead of rewriting the database file
+    conn.execute("PRAGMA journal_mode = WAL")
+
+    # With WAL, NORMAL only syncs at checkpoints and is still crash-safe
+    conn.execute("PRAGMA synchronous = NORMAL")
+
+    # Wait up to 5s for a lock instead of failing with "database is locked"
+    conn.execute("PRAGMA busy_timeout = 5000")
+
+    # Keep temp tables/indices in memory, use a 64MB page cache and
+    # memory-map up to 256MB of the database file
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -65536")
+    conn.execute("PRAGMA mmap_size = 268435456")
     
     # Return rows as dict-like objects instead of tuples
     conn.row_factory = sqlite3.Row
@@ -89,12 +105,22 @@ class DatabaseManager:
 
         Automatically commits on success, rolls back on exception.
 
+        The transaction starts with BEGIN IMMEDIATE, taking the write lock up
+        front instead of upgrading a read lock on the first write (which can
+        fail with "database is locked" under contention). Nested calls join
+        the outer transaction, which does the commit.
+
         Usage: 
             with db_manager.transaction() as conn:
                 conn.execute("INSERT INTO ...")
                 conn.execute("UPDATE ...")
         """
         conn = self.get_connection()
+        if conn.in_transaction:
+            yield conn
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
         try:
             yield conn # Pause here, give conn to 'with' block
              # When 'with' block finishes, resume here
@@ -103,6 +129,29 @@ class DatabaseManager:
             conn.rollback()
             raise
 
+    @contextmanager
+    def bulk_transaction(
+        self,
+        sql: str
+    ) -> Generator[Callable[[Iterable[Sequence[Any]]], None], None, None]:
+        """
+        Context manager for running one statement over many rows.
+
+        Yields a function that runs `sql` with executemany over the rows it's
+        given. Every batch pushed goes into the same transaction, committed
+        once at the end (rolled back on exception).
+
+        Usage:
+            with db_manager.bulk_transaction("INSERT INTO ... VALUES (?, ?)") as push:
+                push(first_batch)
+                push(second_batch)
+        """
+        with self.transaction() as conn:
+            def push(rows: Iterable[Sequence[Any]]) -> None:
+                conn.executemany(sql, rows)
+
+            yield push
+
     def __enter__(self) -> "DatabaseManager":
         """Context manager entry."""
         return self
@@ -111,6 +160,27 @@ class DatabaseManager:
         """Context manager exit - close connection."""
         self.close()
 
+_managers: Dict[Path, DatabaseManager] = {}
+
+def get_database_manager(config: Optional[DatabaseConfig] = None) -> DatabaseManager:
+    """
+    Get the shared DatabaseManager for a database file.
+
+    Reusing one manager per file keeps its connection (and the PRAGMAs
+    applied to it) alive instead of reopening the database each time.
+
+    Args:
+        config: Database configuration. Defaults to DatabaseConfig().
+
+    Returns:
+        The manager for config.db_path, created on first use
+    """
+    config = config or DatabaseConfig()
+    key = config.db_path.absolute()
+    if key not in _managers:
+        _managers[key] = DatabaseManager(config)
+    return _managers[key]
+
 def execute_schema(conn: Connection, schema_path: Path) -> None:
     """
     Execute a SQL schema file.
@@ -57,6 +57,10 @@ CREATE INDEX IF NOT EXISTS idx_transactions_account
 CREATE INDEX IF NOT EXISTS idx_transactions_month
     ON transactions(date, category, type);
 
+-- Covering index for the per-category totals of the monthly report
+CREATE INDEX IF NOT EXISTS idx_transactions_month_totals
+    ON transactions(date, type, category, amount);
+
 -- Trigger to update updated_at timestamp
 CREATE TRIGGER IF NOT EXISTS update_transactions_timestamp
     AFTER UPDATE ON transactions
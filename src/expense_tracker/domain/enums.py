@@ -1,6 +1,16 @@
 from enum import Enum
 
 class TransactionType(Enum):
-    """Represents whether money is coming in or out"""
+    """
+    Represents whether money is coming in or out.
+
+    Members are singletons, so compare them with `is`. The string values
+    are what the database and rules config store.
+    """
     DEBIT = "Debit" # out
-    CREDIT = "Credit" # in
\ No newline at end of file
+    CREDIT = "Credit" # in
+
+    # Enum hashes the member name in Python code. Members are only ever
+    # equal to themselves, so the C-level identity hash is equivalent and
+    # makes dict lookups and Transaction hashing cheaper.
+    __hash__ = object.__hash__
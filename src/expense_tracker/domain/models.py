@@ -1,12 +1,23 @@
-from dataclasses import dataclass
-from decimal import Decimal
+from dataclasses import dataclass, field
+from decimal import Decimal, ROUND_HALF_UP
 from datetime import date
 from typing import Optional
 from expense_tracker.domain.enums import TransactionType
 
-@dataclass
+def to_cents(amount) -> int:
+    """Convert a dollar amount to whole cents, rounding half up"""
+    return int((Decimal(amount) * 100).to_integral_value(ROUND_HALF_UP))
+
+@dataclass(slots=True, frozen=True)
 class Transaction:
-    """Core domain model representing a single transaction"""
+    """
+    Core domain model representing a single transaction.
+
+    Instances are immutable - use `dataclasses.replace` to derive a copy
+    with a different category or id. `amount_cents`, the signed amount and
+    the hash are computed once in `__post_init__`, so dedup sets and
+    summary totals don't redo that work on every access.
+    """
     date: date
     description: str
     amount: Decimal
@@ -15,16 +26,38 @@ class Transaction:
     category: Optional[str] = None
     raw_data: Optional[str] = None
     id: Optional[str] = None
+    amount_cents: int = field(init=False, repr=False, compare=False)
+    _signed_amount: Decimal = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        cents = to_cents(self.amount)
+        object.__setattr__(self, "amount_cents", cents)
+        object.__setattr__(
+            self,
+            "_signed_amount",
+            self.amount if self.type is TransactionType.CREDIT else -self.amount
+        )
+        object.__setattr__(
+            self,
+            "_hash",
+            hash((self.date.toordinal(), self.description, cents, self.type))
+        )
 
     def __hash__(self):
         """Hash for duplicate detection"""
-        return hash((self.date, self.description, self.amount, self.type))
+        return self._hash
     
+    @property
+    def dedup_key(self) -> tuple:
+        """Fields that identify the same transaction across imports"""
+        return (self.date, self.description, self.amount_cents, self.account)
+
     @property
     def signed_amount(self):
         """Return amount with sign for net calculations"""
-        return self.amount if self.type == TransactionType.CREDIT else -self.amount
+        return self._signed_amount
     
     def __repr__(self):
-        sign = "+" if self.type == TransactionType.CREDIT else "-"
-        return f"Transaction({self.date}, {self.description[:30]}, {self.category}, {sign}${self.amount})"
\ No newline at end of file
+        sign = "+" if self.type is TransactionType.CREDIT else "-"
+        return f"Transaction({self.date}, {self.description[:30]}, {self.category}, {sign}${self.amount})"
@@ -0,0 +1,100 @@
+"""
+Numba-compiled parsing of statement amounts into integer cents.
+
+Amount cells look like "$1,234.50" or "-$24.55". The strings are packed
+into one UTF-8 buffer (see `pack_strings`) and parsed byte by byte in
+nopython mode, in parallel across cells, without creating a Python float
+or string per cell.
+
+numba is optional. If it isn't installed `parse_cents` is None and
+callers should use their regular pandas path.
+"""
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from expense_tracker.categorization._numba_kernel import pack_strings
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, parallel=True)
+    def _parse(offsets, buffer, out, valid):
+        """
+        Parse every packed amount into cents.
+
+        "$", "," and spaces are ignored and a leading "-" negates. Digits
+        past the second decimal are dropped, rounding half up on the third.
+        valid[i] is False when cell i has no digits or any other character.
+        """
+        for i in numba.prange(offsets.shape[0] - 1):
+            cents = 0
+            decimals = -1  # -1 until the decimal point is seen
+            negative = False
+            has_digit = False
+            round_up = False
+            ok = True
+
+            for j in range(offsets[i], offsets[i + 1]):
+                c = buffer[j]
+                if c == 36 or c == 44 or c == 32:  # "$" "," " "
+                    continue
+                if c == 45:  # "-"
+                    if negative or has_digit:
+                        ok = False
+                        break
+                    negative = True
+                elif c == 46:  # "."
+                    if decimals >= 0:
+                        ok = False
+                        break
+                    decimals = 0
+                elif 48 <= c <= 57:
+                    digit = c - 48
+                    has_digit = True
+                    if decimals < 0:
+                        cents = cents * 10 + digit
+                    elif decimals < 2:
+                        cents = cents * 10 + digit
+                        decimals += 1
+                    else:
+                        if decimals == 2:
+                            round_up = digit >= 5
+                        decimals += 1
+                else:
+                    ok = False
+                    break
+
+            if decimals <= 0:
+                cents *= 100
+            elif decimals == 1:
+                cents *= 10
+            if round_up:
+                cents += 1
+
+            out[i] = -cents if negative else cents
+            valid[i] = ok and has_digit
+
+    def parse_cents(values: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Parse amount strings into integer cents.
+
+        Args:
+            values: Amount strings, e.g. "$1,234.50"
+
+        Returns:
+            (int64 cents, bool valid) arrays, one entry per value
+        """
+        offsets, buffer = pack_strings(values)
+        out = np.empty(len(values), dtype=np.int64)
+        valid = np.empty(len(values), dtype=np.bool_)
+        _parse(offsets, buffer, out, valid)
+        return out, valid
+
+else:
+    parse_cents = None
@@ -1,11 +1,18 @@
-from typing import List
+import re
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
 from pathlib import Path
 from decimal import Decimal 
+import openpyxl
 import pandas as pd
 from expense_tracker.parsers.base import StatementParser
 from expense_tracker.domain.models import Transaction
 from expense_tracker.domain.enums import TransactionType
 
+# Statements with at least this many rows parse amounts with the Numba
+# kernel when numba is installed
+_NUMBA_THRESHOLD = 500
+
 class AmexExcelParser(StatementParser):
     """
     Parser for American Express Excel/XLS Statements.
@@ -23,6 +30,20 @@ class AmexExcelParser(StatementParser):
     AMOUNT_COL = "Amount"
     CARDMEMBER_COL = "Cardmember"
     MERCHANT_ADDR_COL = "Merchant Address"
+    ADDITIONAL_INFO_COL = "Additional Information"
+
+    # The header row is one of the first HEADER_SCAN_ROWS rows and mentions
+    # date, description and amount in any order
+    HEADER_SCAN_ROWS = 20
+    _HEADER_RE = re.compile(r"(?=.*date)(?=.*description)(?=.*amount)", re.IGNORECASE | re.DOTALL)
+
+    # Date formats seen in Amex statements, tried in order on the first
+    # text date of a statement to pick one format for the whole column
+    DATE_FORMATS = ("%d %b. %Y", "%d %b %Y", "%m/%d/%Y", "%Y-%m-%d")
+
+    # ((path, mtime, size), transaction rows) of the last statement read, so
+    # parse() reuses what validate_file() already read
+    _cached_statement: Optional[Tuple[Tuple[Path, int, int], pd.DataFrame]] = None
 
     def validate_file(self, filepath):
         """
@@ -43,21 +64,7 @@ class AmexExcelParser(StatementParser):
         if path.suffix.lower() not in ['.xlsx', '.xls']:
             raise ValueError(f"File must be .xlsx or .xls, got {path.suffix}")
         
-        try:
-            df_raw = pd.read_excel(filepath, header=None)
-        except Exception as e:
-            print(f"Validation error: {e}")
-            raise Exception
-        
-        header_row = self._find_header_row(df_raw)
-        if header_row is None:
-            raise ValueError(f"Could not find a header row in the file")
-        
-        try:
-            df = pd.read_excel(filepath, header=header_row)
-        except Exception as e:
-            print(f"Validation error: {e}")
-            raise Exception
+        df = self._load_statement(path)
         
         required_columns = [self.DATE_COL, self.DESCRIPTION_COL, self.AMOUNT_COL]
 
@@ -77,47 +84,252 @@ class AmexExcelParser(StatementParser):
             raise ValueError(f"Invalid file: {e}")
 
         try:
-            # Read the entire file first to find the header row
-            df_raw = pd.read_excel(filepath, header=None)
-            
-            # Find the row with column headers (contains 'Date', 'Description', 'Amount')
-            header_row = self._find_header_row(df_raw)
-            
-            if header_row is None:
-                raise ValueError("Could not find transaction header row in file")
-            
-            # Now read again with the correct header
-            df = pd.read_excel(filepath, header=header_row)
-            
+            # Already read by validate_file, this only reads again if the
+            # file changed in between
+            df = self._load_statement(Path(filepath))
         except Exception as e:
             raise ValueError(f"Failed to read Excel file: {e}")
+        finally:
+            self._cached_statement = None
         
         # Validate required columns exist (should pass since validate_file checked this)
         self._validate_columns(df)
         
-        # Parse transactions
+        return self._parse_frame(df)
+
+    def _parse_frame(self, df: pd.DataFrame) -> List[Transaction]:
+        """
+        Parse every transaction row of the statement at once.
+
+        Works column by column instead of row by row: credit detection,
+        amount cleaning, date parsing and description selection are each a
+        single pandas operation, and Transactions are built from plain
+        Python lists at the end.
+
+        Args:
+            df: Statement rows, with the header row as columns
+
+        Returns:
+            List of parsed transactions
+        """
+        empty = pd.Series(None, index=df.index, dtype=object)
+        description = df[self.DESCRIPTION_COL]
+        cardmember = df[self.CARDMEMBER_COL] if self.CARDMEMBER_COL in df.columns else empty
+        merchant = df[self.MERCHANT_ADDR_COL] if self.MERCHANT_ADDR_COL in df.columns else empty
+        additional = df[self.ADDITIONAL_INFO_COL] if self.ADDITIONAL_INFO_COL in df.columns else empty
+
+        # Credit rows (grey rows) have their amount in the Cardmember column
+        # and their description in Merchant Address, see _is_credit_row()
+        cardmember_str = cardmember.fillna("").astype(str)
+        credit_mask = (
+            description.isna()
+            & (cardmember_str.str.contains("-&", regex=False) | cardmember_str.str.startswith("-"))
+        ) | merchant.notna()
+
+        raw_amount = df[self.AMOUNT_COL].where(~credit_mask, cardmember)
+        amounts = self._parse_cents(raw_amount.astype(str))
+
+        dates = self._parse_dates(df[self.DATE_COL])
+
+        credit_description = (
+            merchant.astype(str).str.strip()
+            .where(merchant.notna(), additional.astype(str).str.strip())
+            .where(merchant.notna() | additional.notna(), "CREDIT")
+        )
+        descriptions = credit_description.where(credit_mask, description.astype(str).str.strip())
+
+        # Skip rows with missing date or amount, warn about ones that don't parse
+        valid = df[self.DATE_COL].notna() & raw_amount.notna()
+        unparseable = valid & (dates.isna() | amounts.isna())
+        for index in df.index[unparseable]:
+            print(
+                f"Warning: Skipping row due to error: could not parse "
+                f"date {df.at[index, self.DATE_COL]!r} or amount {raw_amount[index]!r}"
+            )
+        valid &= ~unparseable
+
+        # Tracking payments will mess with the overall budget total
+        # I've removed this for now because it might make more sense to keep if we have a statement from the bank of this money leaving the account (it'll even itself out)
+        # valid &= ~merchant.eq('PAYMENT RECEIVED - THANK YOU')
+
         transactions = []
-        for _, row in df.iterrows():
+        for date, description, amount, is_credit in zip(
+            dates[valid].dt.date.tolist(),
+            descriptions[valid].tolist(),
+            amounts[valid].tolist(),
+            credit_mask[valid].tolist(),
+        ):
+            if is_credit:
+                # For credit rows, amount is already negative
+                amount = Decimal(abs(int(amount))).scaleb(-2)
+                transaction_type = TransactionType.CREDIT
+            else:
+                amount = Decimal(int(amount)).scaleb(-2)
+                transaction_type = TransactionType.DEBIT
+
+            transactions.append(Transaction(
+                date=date,
+                description=description,
+                amount=amount,
+                type=transaction_type,
+                account="amex",
+                category=None
+            ))
+
+        return transactions
+
+
+    def _parse_cents(self, values: pd.Series) -> pd.Series:
+        """
+        Parse amount cells like "$1,234.50" into cents.
+
+        Large statements go through the Numba kernel when numba is
+        installed, anything it rejects is retried with pandas.
+
+        Args:
+            values: Amount cells as strings
+
+        Returns:
+            float Series of whole cents, NaN where an amount couldn't be parsed
+        """
+        cents = pd.Series(float("nan"), index=values.index)
+        todo = pd.Series(True, index=values.index)
+
+        if len(values) >= _NUMBA_THRESHOLD:
+            # Imported here so numba (if installed) only loads for big statements
+            from expense_tracker.parsers._numba_amounts import parse_cents
+            if parse_cents is not None:
+                parsed, valid = parse_cents(values.tolist())
+                cents[valid] = parsed[valid]
+                todo = pd.Series(~valid, index=values.index)
+
+        if todo.any():
+            cleaned = values[todo].str.replace(r"[$,]", "", regex=True).str.strip()
+            cents[todo] = (pd.to_numeric(cleaned, errors="coerce") * 100).round()
+
+        return cents
+
+    def _parse_dates(self, values: pd.Series) -> pd.Series:
+        """
+        Parse the date column with one explicit format.
+
+        The format is detected from the first text date (see DATE_FORMATS),
+        so pandas doesn't infer it cell by cell. Cells that don't match it
+        (or all of them, if no format fits) fall back to format="mixed".
+        Cells that are already dates (e.g. from .xlsx) convert either way.
+
+        Args:
+            values: Raw date column
+
+        Returns:
+            datetime64 Series, NaT where a date couldn't be parsed
+        """
+        date_format = self._detect_date_format(values)
+        if date_format is None:
+            return pd.to_datetime(values, format="mixed", errors="coerce")
+
+        dates = pd.to_datetime(values, format=date_format, errors="coerce")
+        retry = dates.isna() & values.notna()
+        if retry.any():
+            dates[retry] = pd.to_datetime(values[retry], format="mixed", errors="coerce")
+        return dates
+
+    def _detect_date_format(self, values: pd.Series) -> Optional[str]:
+        """Return the first of DATE_FORMATS matching the first text date, if any."""
+        sample = next((v.strip() for v in values if isinstance(v, str)), None)
+        if sample is None:
+            return None
+
+        for date_format in self.DATE_FORMATS:
             try:
-                if not self._valid_row(row):
-                    continue
-
-                # Tracking payments will mess with the overall budget total
-                # I've removed this for now because it might make more sense to keep if we have a statement from the bank of this money leaving the account (it'll even itself out)
-                # if self._is_payment_row(row):
-                #     continue
-                    
-                transaction = self._parse_row(row)
-                if transaction:
-                    transactions.append(transaction)
-            except Exception as e:
-                print(f"Warning: Skipping row due to error: {e}")
+                datetime.strptime(sample, date_format)
+            except ValueError:
                 continue
+            return date_format
+
+        return None
+
+    def _load_statement(self, path: Path) -> pd.DataFrame:
+        """
+        Read the statement and return its transaction rows.
+
+        The file is read once and split at the header row in memory,
+        instead of being read again with the right `header=`. The result is
+        cached until the file's mtime or size changes.
+
+        Args:
+            path: Path to the statement
+
+        Returns:
+            DataFrame of the rows below the header, with the header as columns
+
+        Raises:
+            ValueError: If no header row is found
+        """
+        stat = path.stat()
+        key = (path.resolve(), stat.st_mtime_ns, stat.st_size)
+        if self._cached_statement is not None and self._cached_statement[0] == key:
+            return self._cached_statement[1]
+
+        try:
+            rows = self._read_rows(path)
+        except Exception as e:
+            print(f"Validation error: {e}")
+            raise Exception
         
-        return transactions
+        header_row = self._find_header_row(rows)
+        if header_row is None:
+            raise ValueError(f"Could not find a header row in the file")
+
+        columns = self._column_names(rows[header_row])
+        width = len(columns)
+        df = pd.DataFrame(
+            [row[:width] for row in rows[header_row + 1:]],
+            columns=columns,
+            dtype=object
+        )
+
+        self._cached_statement = (key, df)
+        return df
+
+    def _read_rows(self, path: Path) -> List[Tuple[Any, ...]]:
+        """
+        Read every row of the first sheet as a tuple of cell values.
 
+        .xlsx files are streamed with openpyxl in read-only mode. openpyxl
+        can't open legacy .xls files, so those go through pandas (xlrd).
+        """
+        if path.suffix.lower() == '.xlsx':
+            workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+            try:
+                return list(workbook.active.iter_rows(values_only=True))
+            finally:
+                workbook.close()
+
+        df_raw = pd.read_excel(path, header=None)
+        return list(df_raw.itertuples(index=False, name=None))
+
+    @staticmethod
+    def _column_names(header: Sequence[Any]) -> List[str]:
+        """
+        Turn a header row into column names, the way pandas.read_excel would.
+
+        Empty cells become "Unnamed: <i>" and repeated names get a ".1",
+        ".2", ... suffix.
+        """
+        columns = []
+        seen = {}
+        for i, value in enumerate(header):
+            name = f"Unnamed: {i}" if pd.isna(value) else str(value)
+            if name in seen:
+                seen[name] += 1
+                name = f"{name}.{seen[name]}"
+            else:
+                seen[name] = 0
+            columns.append(name)
+        return columns
 
-    def _find_header_row(self, df_raw: pd.DataFrame) -> int:
+    def _find_header_row(self, rows: Sequence[Sequence[Any]]) -> Optional[int]:
         """
         Find the row index that contains the column headers.
         
@@ -126,13 +338,12 @@ class AmexExcelParser(StatementParser):
         Returns:
             Row index if found, None otherwise
         """
-        for i in range(min(20, len(df_raw))):
-            row = df_raw.iloc[i]
-            row_str = ' '.join([str(x).lower() for x in row if pd.notna(x)])
-            
-            if 'date' in row_str and 'description' in row_str and 'amount' in row_str:
+        for i, row in enumerate(rows[:self.HEADER_SCAN_ROWS]):
+            row_str = ' '.join([str(x) for x in row if pd.notna(x)])
+
+            if self._HEADER_RE.match(row_str):
                 return i
-            
+
         return None
     
     def _validate_columns(self, df: pd.DataFrame) -> None:
@@ -156,10 +367,10 @@ class AmexExcelParser(StatementParser):
         if is_credit_row:
             # the amount is shown in the cardmember col
             if pd.isna(row[self.CARDMEMBER_COL]):
-                False
+                return False
         else:
             if pd.isna(row[self.AMOUNT_COL]):
-                False
+                return False
 
         return True
     
@@ -214,8 +425,8 @@ class AmexExcelParser(StatementParser):
             # Description is in a different column - try 'Merchant Address' or 'Additional Information'
             if pd.notna(row.get(self.MERCHANT_ADDR_COL)):
                 description = str(row[self.MERCHANT_ADDR_COL]).strip()
-            elif pd.notna(row.get('Additional Information')):
-                description = str(row['Additional Information']).strip()
+            elif pd.notna(row.get(self.ADDITIONAL_INFO_COL)):
+                description = str(row[self.ADDITIONAL_INFO_COL]).strip()
             else:
                 description = "CREDIT"  
 
@@ -1,10 +1,18 @@
-import pdfplumber
+import multiprocessing
 import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from itertools import repeat
 from decimal import Decimal
 from typing import List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import pymupdf
+except ImportError:
+    # Optional dependency - text is extracted with pdfplumber instead
+    pymupdf = None
+
 from expense_tracker.domain.models import Transaction
 from expense_tracker.domain.enums import TransactionType
 from expense_tracker.parsers.base import StatementParser
@@ -42,25 +50,58 @@ class CIBCCostcoCreditCardParser(StatementParser):
     
     # Patterns for section detection
     SECTION_MARKERS = {
-        'payments': r'Your payments',
-        'charges': r'Your new charges and credits',
-        'summary': r'Your account at a glance',
+        'payments': re.compile(r'Your payments', re.IGNORECASE),
+        'charges': re.compile(r'Your new charges and credits', re.IGNORECASE),
+        'summary': re.compile(r'Your account at a glance', re.IGNORECASE),
     }
     
     # Patterns to skip
     SKIP_PATTERNS = [
-        r'^Card number',
-        r'^Trans\s+Post',
-        r'^date\s+date',
-        r'^Ý\s*$',  # Just the bonus marker alone
-        r'^Page \d+',
-        r'Identifies transactions',
-        r'^Total payments',
-        r'^Total for',
-        r'^Information about',
-        r'^\s*$',  # Empty lines
+        re.compile(pattern, re.IGNORECASE)
+        for pattern in (
+            r'^Card number',
+            r'^Trans\s+Post',
+            r'^date\s+date',
+            r'^Ý\s*$',  # Just the bonus marker alone
+            r'^Page \d+',
+            r'Identifies transactions',
+            r'^Total payments',
+            r'^Total for',
+            r'^Information about',
+            r'^\s*$',  # Empty lines
+        )
     ]
+
+    # Line patterns, compiled once instead of looked up in re's cache per line
+    _CARD_RE = re.compile(r'Card number\s+(\d{4}\s+X+\s+X+\s+\d{4})')
+    _SECTION_END_RE = re.compile(r'^Total (payments|for)', re.IGNORECASE)
+    # trans_date post_date description amount, dates like "Nov 27" or "Dec 5"
+    _PAYMENT_RE = re.compile(r'^(\w{3}\s+\d{1,2})\s+\w{3}\s+\d{1,2}\s+(.+?)\s+([\d,]+\.\d{2})$')
+    _CHARGE_START_RE = re.compile(r'^\w{3}\s+\d{1,2}')
+    _AMOUNT_RE = re.compile(r'(-?[\d,]+\.\d{2})$')
+    _STATEMENT_DATE_RE = re.compile(r'Statement Date[^\d]*(\w+)\s+(\d{1,2}),?\s+(\d{4})', re.IGNORECASE)
+    _STATEMENT_RANGE_RE = re.compile(r'(\w+)\s+\d{1,2}\s+to\s+(\w+)\s+\d{1,2},?\s+(\d{4})')
+
+    # Classifies a line in one match for _parse_page_text, with the same
+    # precedence as the separate checks: section change, card number,
+    # section end, then the skip patterns (which apply to the stripped line)
+    _DISPATCH_RE = re.compile(
+        r'(?=.*?(?P<payments>(?i:Your payments)))'
+        r'|(?=.*?(?P<charges>(?i:Your new charges and credits)))'
+        r'|(?=.*?Card number\s+(?P<card>\d{4}\s+X+\s+X+\s+\d{4}))'
+        r'|(?P<end>(?i:Total (?:payments|for)))'
+        r'|(?P<skip>\s*(?i:' + '|'.join(p.pattern.lstrip('^') for p in SKIP_PATTERNS) + r'))'
+    )
     
+    # Words whose tops are within this many points are on the same line,
+    # pdfplumber's default y_tolerance
+    LINE_TOLERANCE = 3
+
+    # Statements with this many transaction pages are parsed in a process
+    # pool; below it, spawning the workers and pickling the transactions
+    # back costs more than it saves
+    PARALLEL_PAGE_THRESHOLD = 64
+
     def __init__(self):
         """Initialize the parser"""
         self.statement_year = None
@@ -78,6 +119,11 @@ class CIBCCostcoCreditCardParser(StatementParser):
             FileNotFoundError: If file doesn't exist
             ValueError: If file is not a valid CIBC Costco statement
         """
+        self._validate_path(filepath)
+        self._validate_content(self._read_pages_for_validation(filepath, max_pages=1))
+
+    def _validate_path(self, filepath: str) -> None:
+        """Check the file exists and is a PDF."""
         path = Path(filepath)
         
         if not path.exists():
@@ -85,37 +131,50 @@ class CIBCCostcoCreditCardParser(StatementParser):
         
         if path.suffix.lower() != '.pdf':
             raise ValueError(f"File must be a PDF, got: {path.suffix}")
-        
+
+    def _read_pages_for_validation(self, filepath: str, max_pages: Optional[int] = None) -> List[str]:
+        """_read_page_texts, with read errors reported as validation errors."""
         try:
-            with pdfplumber.open(filepath) as pdf:
-                if not pdf.pages:
-                    raise ValueError("PDF has no pages")
-                
-                first_page_text = pdf.pages[0].extract_text()
-                
-                if not first_page_text:
-                    raise ValueError("Could not extract text from PDF")
-                
-                # Check for required identifiers
-                required_identifiers = [
-                    "CIBC Costco World Mastercard",
-                    "Your account at a glance",
-                ]
-                
-                for identifier in required_identifiers:
-                    if identifier not in first_page_text:
-                        raise ValueError(
-                            f"Not a CIBC Costco statement - missing: {identifier}"
-                        )
-                        
+            return self._read_page_texts(filepath, max_pages=max_pages)
         except Exception as e:
-            if isinstance(e, (FileNotFoundError, ValueError)):
-                raise
             raise ValueError(f"Error validating PDF: {e}")
+
+    def _validate_content(self, page_texts: List[str]) -> None:
+        """
+        Check the extracted text is from a CIBC Costco statement.
+
+        Args:
+            page_texts: Text of the statement's pages (at least the first)
+
+        Raises:
+            ValueError: If the first page lacks the statement identifiers
+        """
+        if not page_texts:
+            raise ValueError("PDF has no pages")
+        
+        first_page_text = page_texts[0]
+        
+        if not first_page_text:
+            raise ValueError("Could not extract text from PDF")
+        
+        # Check for required identifiers
+        required_identifiers = [
+            "CIBC Costco World Mastercard",
+            "Your account at a glance",
+        ]
+        
+        for identifier in required_identifiers:
+            if identifier not in first_page_text:
+                raise ValueError(
+                    f"Not a CIBC Costco statement - missing: {identifier}"
+                )
     
     def parse(self, filepath: str) -> List[Transaction]:
         """
         Parse transactions from CIBC Costco statement.
+
+        The PDF is read once - validation checks the same extracted text
+        that gets parsed, instead of opening the file a second time.
         
         Args:
             filepath: Path to the PDF statement
@@ -126,30 +185,27 @@ class CIBCCostcoCreditCardParser(StatementParser):
         Raises:
             ValueError: If file is invalid or parsing fails
         """
-        self.validate_file(filepath)
+        self._validate_path(filepath)
+        page_texts = self._read_pages_for_validation(filepath)
+        self._validate_content(page_texts)
         
         transactions = []
         
         try:
-            with pdfplumber.open(filepath) as pdf:
-                # Extract metadata from first page
-                self._extract_statement_metadata(pdf.pages[0])
-                
-                # Parse each page
-                for page_num, page in enumerate(pdf.pages):
-                    text = page.extract_text()
-                    
-                    if not text:
-                        print(f"Warning: No text extracted from page {page_num + 1}")
-                        continue
-                    
-                    # Skip first page (summary only)
-                    if page_num == 0:
-                        continue
-                    
-                    # Parse transactions from this page
-                    page_txns = self._parse_page_text(text)
-                    transactions.extend(page_txns)
+            # Extract metadata from first page
+            self._extract_statement_metadata(page_texts[0])
+            
+            # Parse each page after the first (summary only, already
+            # read for validation and metadata)
+            texts = []
+            for page_num, text in enumerate(page_texts[1:], start=1):
+                if not text:
+                    print(f"Warning: No text extracted from page {page_num + 1}")
+                    continue
+                texts.append(text)
+            
+            for page_txns in self._parse_pages(texts):
+                transactions.extend(page_txns)
                     
         except Exception as e:
             raise ValueError(f"Error parsing PDF: {e}")
@@ -159,21 +215,107 @@ class CIBCCostcoCreditCardParser(StatementParser):
         
         return transactions
     
-    def _extract_statement_metadata(self, first_page) -> None:
+    def _parse_pages(self, texts: List[str]) -> List[List[Transaction]]:
+        """
+        Parse transactions from each page of text, in page order.
+
+        Statements with at least PARALLEL_PAGE_THRESHOLD pages are parsed in
+        a process pool. The only state carried between pages is the card
+        number, so it is worked out up front for each page and handed to
+        the workers along with the statement year. Warnings printed by the
+        workers go to their own stdout, not in page order.
+
+        Args:
+            texts: Text of the pages to parse
+
+        Returns:
+            Transactions of each page
+        """
+        if len(texts) < self.PARALLEL_PAGE_THRESHOLD:
+            return [self._parse_page_text(text) for text in texts]
+
+        card_numbers = []
+        for text in texts:
+            card_numbers.append(self.current_card_number)
+            for line in text.split('\n'):
+                match = self._DISPATCH_RE.match(line)
+                if match is not None and match.lastgroup == "card":
+                    self.current_card_number = match.group("card")
+
+        # spawn rather than fork: forking after numba's parallel kernels
+        # have started their thread pool deadlocks the children
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(mp_context=context) as executor:
+            return list(executor.map(
+                _parse_page_worker, texts, repeat(self.statement_year), card_numbers
+            ))
+
+    def _read_page_texts(self, filepath: str, max_pages: Optional[int] = None) -> List[str]:
+        """
+        Extract the text of each page, one line per row of text.
+
+        Uses PyMuPDF when it's installed, which is several times faster than
+        pdfplumber. PyMuPDF lays text out by block, so table columns would
+        end up on separate lines - words are regrouped into rows by
+        position (see _join_words) to get the same lines pdfplumber gives.
+
+        Args:
+            filepath: Path to the PDF
+            max_pages: Only read this many pages from the start
+
+        Returns:
+            Text of each page read, "" for pages without text
+        """
+        if pymupdf is not None:
+            with pymupdf.open(filepath) as pdf:
+                count = len(pdf) if max_pages is None else min(max_pages, len(pdf))
+                return [self._join_words(pdf[i].get_text("words")) for i in range(count)]
+
+        import pdfplumber
+        with pdfplumber.open(filepath) as pdf:
+            return [page.extract_text() or "" for page in pdf.pages[:max_pages]]
+
+    def _join_words(self, words: List[tuple]) -> str:
+        """
+        Join PyMuPDF words into lines of text.
+
+        Words are grouped into a line while their tops are within
+        LINE_TOLERANCE of the line's first word, then ordered left to
+        right, like pdfplumber's extract_text().
+
+        Args:
+            words: (x0, y0, x1, y1, text, ...) tuples from page.get_text("words")
+
+        Returns:
+            Page text with one line per row
+        """
+        lines = []
+        current = []
+        top = 0.0
+        for word in sorted(words, key=lambda w: (w[1], w[0])):
+            if current and word[1] - top > self.LINE_TOLERANCE:
+                lines.append(current)
+                current = []
+            if not current:
+                top = word[1]
+            current.append(word)
+        if current:
+            lines.append(current)
+
+        return "\n".join(
+            " ".join(word[4] for word in sorted(line, key=lambda w: w[0]))
+            for line in lines
+        )
+
+    def _extract_statement_metadata(self, text: str) -> None:
         """
         Extract statement year and month from first page.
         
         Args:
-            first_page: pdfplumber page object
+            text: Text of the first page
         """
-        text = first_page.extract_text()
-        
         # Look for "Statement Date\nDecember 20, 2025"
-        date_match = re.search(
-            r'Statement Date[^\d]*(\w+)\s+(\d{1,2}),?\s+(\d{4})',
-            text,
-            re.IGNORECASE
-        )
+        date_match = self._STATEMENT_DATE_RE.search(text)
         
         if date_match:
             month_str, _, year = date_match.groups()
@@ -181,10 +323,7 @@ class CIBCCostcoCreditCardParser(StatementParser):
             self.statement_month = month_str
         else:
             # Fallback: look for any date in format "November 21 to December 20, 2025"
-            range_match = re.search(
-                r'(\w+)\s+\d{1,2}\s+to\s+(\w+)\s+\d{1,2},?\s+(\d{4})',
-                text
-            )
+            range_match = self._STATEMENT_RANGE_RE.search(text)
             if range_match:
                 _, end_month, year = range_match.groups()
                 self.statement_year = int(year)
@@ -213,20 +352,21 @@ class CIBCCostcoCreditCardParser(StatementParser):
         lines = text.split('\n')
         current_section = None
 
-        for line_num, line in enumerate(lines):
-            section = self._detect_section_change(line)
-            if section is not None:
-                current_section = section
-                continue
-
-            if self._detect_card_number(line):
-                continue
+        dispatch = self._DISPATCH_RE.match
 
-            if self._is_section_end(line):
-                current_section = None
+        for line_num, line in enumerate(lines):
+            match = dispatch(line)
+            if match is not None:
+                kind = match.lastgroup
+                if kind == "payments" or kind == "charges":
+                    current_section = kind
+                elif kind == "card":
+                    self.current_card_number = match.group("card")
+                elif kind == "end":
+                    current_section = None
                 continue
 
-            if current_section is None or self._should_skip_line(line):
+            if current_section is None:
                 continue
 
             txn = self._parse_transaction_line(line, current_section, line_num)
@@ -236,21 +376,21 @@ class CIBCCostcoCreditCardParser(StatementParser):
         return transactions
 
     def _detect_section_change(self, line: str) -> Optional[str]:
-        if re.search(self.SECTION_MARKERS['payments'], line, re.IGNORECASE):
+        if self.SECTION_MARKERS['payments'].search(line):
             return "payments"
-        elif re.search(self.SECTION_MARKERS['charges'], line, re.IGNORECASE):
+        elif self.SECTION_MARKERS['charges'].search(line):
             return "charges"
         return None
 
     def _detect_card_number(self, line: str) -> bool:
-        card_match = re.search(r'Card number\s+(\d{4}\s+X+\s+X+\s+\d{4})', line)
+        card_match = self._CARD_RE.search(line)
         if card_match:
             self.current_card_number = card_match.group(1)
             return True
         return False
 
     def _is_section_end(self, line: str) -> bool:
-        return re.match(r'^Total (payments|for)', line, re.IGNORECASE) is not None
+        return self._SECTION_END_RE.match(line) is not None
 
     def _parse_transaction_line(self, line: str, current_section: str, line_num: int) -> Optional[Transaction]:
         try:
@@ -282,7 +422,7 @@ class CIBCCostcoCreditCardParser(StatementParser):
         
         # Match against skip patterns
         for pattern in self.SKIP_PATTERNS:
-            if re.match(pattern, line, re.IGNORECASE):
+            if pattern.match(line):
                 return True
         
         return False
@@ -301,11 +441,7 @@ class CIBCCostcoCreditCardParser(StatementParser):
         """
         line = line.strip()
         
-        # Pattern: trans_date post_date description amount
-        # Date format: "Nov 27" or "Dec 5"
-        pattern = r'^(\w{3}\s+\d{1,2})\s+\w{3}\s+\d{1,2}\s+(.+?)\s+([\d,]+\.\d{2})$'
-        
-        match = re.match(pattern, line)
+        match = self._PAYMENT_RE.match(line)
         
         if not match:
             return None
@@ -345,11 +481,11 @@ class CIBCCostcoCreditCardParser(StatementParser):
         line = line.replace('Ý', '').strip()
         
         # Must start with a date
-        if not re.match(r'^\w{3}\s+\d{1,2}', line):
+        if not self._CHARGE_START_RE.match(line):
             return None
         
         # Must end with an amount (optionally negative)
-        amount_match = re.search(r'(-?[\d,]+\.\d{2})$', line)
+        amount_match = self._AMOUNT_RE.search(line)
         if not amount_match:
             return None
         
@@ -518,6 +654,14 @@ class CIBCCostcoCreditCardParser(StatementParser):
         return "CIBCCostcoCreditCardParser()"
 
 
+def _parse_page_worker(text: str, statement_year: int, card_number: Optional[str]) -> List[Transaction]:
+    """Parse one page in a worker process, given the state the page starts with."""
+    parser = CIBCCostcoCreditCardParser()
+    parser.statement_year = statement_year
+    parser.current_card_number = card_number
+    return parser._parse_page_text(text)
+
+
 if __name__ == "__main__":
     parser = CIBCCostcoCreditCardParser()
     statement_filepath = '/Users/josegeorges/Documents/Personal/Projects/budget-planner/cibc_costco_credit_card.pdf'
@@ -1,4 +1,3 @@
-import json
 import importlib
 from typing import Optional, Dict, Type, Any
 from expense_tracker.parsers.base import StatementParser
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from datetime import date
-from typing import List, Optional
+from decimal import Decimal
+from typing import Iterable, List, Optional, Set, Tuple
 
 from expense_tracker.domain.models import Transaction
 from expense_tracker.domain.enums import TransactionType
@@ -150,4 +151,76 @@ class TransactionRepository(ABC):
         Returns:
             True if transaction exists
         """
-        pass
\ No newline at end of file
+        pass
+
+    def find_existing(self, transactions: Iterable[Transaction]) -> Set[tuple]:
+        """
+        Find which of the given transactions are already stored.
+
+        Bulk counterpart of exists(). The default checks each transaction
+        with exists(), implementations should override it with a single
+        query.
+
+        Args:
+            transactions: Candidate transactions
+
+        Returns:
+            The `dedup_key` of every candidate that already exists
+        """
+        return {
+            txn.dedup_key
+            for txn in transactions
+            if self.exists(txn.date, txn.description, txn.amount, txn.account)
+        }
+
+    def get_category_totals(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[TransactionType, str, Decimal, int]]:
+        """
+        Total amount and count of transactions per type and category.
+
+        The default aggregates get_all() in Python, implementations should
+        override it to aggregate in the storage backend.
+
+        Args:
+            start_date: Include transactions on or after this date
+            end_date: Include transactions on or before this date
+
+        Returns:
+            (type, category, total, count) tuples, largest total first
+        """
+        totals = {}
+        for txn in self.get_all(start_date=start_date, end_date=end_date):
+            key = (txn.type, txn.category or "Uncategorized")
+            total, count = totals.get(key, (Decimal(0), 0))
+            totals[key] = (total + txn.amount, count + 1)
+
+        return sorted(
+            (
+                (txn_type, category, total, count)
+                for (txn_type, category), (total, count) in totals.items()
+            ),
+            key=lambda row: row[2],
+            reverse=True,
+        )
+
+    def get_recent(
+        self,
+        start_date: date,
+        end_date: date,
+        limit: int,
+    ) -> List[Transaction]:
+        """
+        Most recent transactions in a date range.
+
+        Args:
+            start_date: Include transactions on or after this date
+            end_date: Include transactions on or before this date
+            limit: Maximum number of transactions to return
+
+        Returns:
+            Up to `limit` transactions, newest first
+        """
+        return self.get_all(start_date=start_date, end_date=end_date)[:limit]
@@ -1,11 +1,12 @@
 import json
 import sqlite3
+from dataclasses import replace
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterable, List, Optional, Set, Tuple
 
 from expense_tracker.database.connection import DatabaseManager
-from expense_tracker.domain.models import Transaction
+from expense_tracker.domain.models import Transaction, to_cents
 from expense_tracker.domain.enums import TransactionType
 from expense_tracker.repositories.base import TransactionRepository, DuplicateTransactionError, TransactionNotFoundError
 
@@ -16,11 +17,21 @@ class SQLiteTransactionRepository(TransactionRepository):
     Handles all database operations for transactions using raw SQL.
     """
 
+    # Rows per executemany call in save_many()
+    BATCH_SIZE = 1000
+
+    _INSERT_SQL = """
+        INSERT INTO transactions (
+            date, description, amount, type, account,
+            category, raw_data
+        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, db_manager: DatabaseManager):
         self.db = db_manager
 
     def save(self, transaction: Transaction) -> Transaction:
-        """Save a single transaction."""
+        """Save a single transaction and return a copy carrying its new ID."""
 
         # Check for duplicates
         if self.exists(
@@ -36,58 +47,45 @@ class SQLiteTransactionRepository(TransactionRepository):
         
         # Convert transaction to database row
         with self.db.transaction() as conn:
-            cursor = conn.execute(
-                """
-                INSERT INTO transactions (
-                    date, description, amount, type, account,
-                    category, raw_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    transaction.date,
-                    transaction.description,
-                    str(transaction.amount), # Store as string for precision
-                    transaction.type.value,
-                    transaction.account,
-                    transaction.category,
-                    json.dumps(transaction.raw_data) if transaction.raw_data else None,
-                ),
-            )
-
-            transaction.id = cursor.lastrowid
+            cursor = conn.execute(self._INSERT_SQL, self._to_row(transaction))
 
-        return transaction
+        return replace(transaction, id=cursor.lastrowid)
     
     def save_many(self, transactions: List[Transaction]) -> List[Transaction]:
-        """Save multiple transactions efficiently"""
-        saved = []
+        """
+        Save multiple transactions efficiently.
 
-        with self.db.transaction() as conn:
+        Duplicates (already stored, or repeated within the batch) are
+        skipped, looked up with one find_existing() query. The rest are
+        inserted with executemany in batches of BATCH_SIZE, all in one
+        transaction.
+
+        Returns:
+            Copies of the inserted transactions carrying their new IDs
+        """
+        new: List[Transaction] = []
+
+        with self.db.bulk_transaction(self._INSERT_SQL) as push:
+            seen = self.find_existing(transactions)
             for txn in transactions:
-                if self.exists(txn.date, txn.description, txn.amount, txn.account):
+                key = txn.dedup_key
+                if key in seen:
                     continue
+                seen.add(key)
+                new.append(txn)
 
-                cursor = conn.execute(
-                     """
-                    INSERT INTO transactions (
-                        date, description, amount, type, account,
-                        category, raw_data
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        txn.date,
-                        txn.description,
-                        str(txn.amount),
-                        txn.type.value,
-                        txn.account,
-                        txn.category,
-                        json.dumps(txn.raw_data) if txn.raw_data else None,
-                    ),
-                )
-                txn.id = cursor.lastrowid
-                saved.append(txn)
+            for start in range(0, len(new), self.BATCH_SIZE):
+                push([self._to_row(txn) for txn in new[start:start + self.BATCH_SIZE]])
+
+            last_id = self.db.get_connection().execute("SELECT last_insert_rowid()").fetchone()[0]
 
-        return saved
+        # We held the write lock for the whole batch, so AUTOINCREMENT handed
+        # out consecutive ids ending at last_id
+        first_id = last_id - len(new) + 1
+        return [
+            replace(txn, id=first_id + offset)
+            for offset, txn in enumerate(new)
+        ]
     
     def get_by_id(self, transaction_id: int) -> Optional[Transaction]:
         """Retrieve a transaction by ID, or None if it doesn't exist"""
@@ -232,6 +230,99 @@ class SQLiteTransactionRepository(TransactionRepository):
         )
         return cursor.fetchone() is not None
     
+    def find_existing(self, transactions: Iterable[Transaction]) -> Set[tuple]:
+        """
+        Find which of the given transactions are already stored.
+
+        Loads the dedup keys of every stored transaction between the
+        earliest and latest candidate date in one query, instead of one
+        exists() query per candidate.
+        """
+        transactions = list(transactions)
+        if not transactions:
+            return set()
+
+        dates = [txn.date for txn in transactions]
+        conn = self.db.get_connection()
+        cursor = conn.execute(
+            """
+            SELECT date, description, amount, account FROM transactions
+            WHERE date BETWEEN ? AND ?
+            """,
+            (min(dates), max(dates)),
+        )
+        stored = {
+            (row["date"], row["description"], to_cents(row["amount"]), row["account"])
+            for row in cursor
+        }
+        return {txn.dedup_key for txn in transactions} & stored
+
+    def get_category_totals(
+        self,
+        start_date: date,
+        end_date: date,
+    ) -> List[Tuple[TransactionType, str, Decimal, int]]:
+        """
+        Total amount and count of transactions per type and category.
+
+        Aggregated by SQLite over idx_transactions_month_totals. Amounts are
+        stored as TEXT, so they're summed as integer cents to stay exact.
+        """
+        conn = self.db.get_connection()
+        cursor = conn.execute(
+            """
+            SELECT type,
+                   COALESCE(category, 'Uncategorized') AS category,
+                   SUM(CAST(ROUND(amount * 100) AS INTEGER)) AS total_cents,
+                   COUNT(*) AS count
+            FROM transactions
+            WHERE date BETWEEN ? AND ?
+            GROUP BY type, COALESCE(category, 'Uncategorized')
+            ORDER BY total_cents DESC
+            """,
+            (start_date, end_date),
+        )
+        return [
+            (
+                TransactionType(row["type"]),
+                row["category"],
+                Decimal(row["total_cents"]).scaleb(-2),
+                row["count"],
+            )
+            for row in cursor
+        ]
+
+    def get_recent(
+        self,
+        start_date: date,
+        end_date: date,
+        limit: int,
+    ) -> List[Transaction]:
+        """Most recent transactions in a date range, newest first."""
+        conn = self.db.get_connection()
+        cursor = conn.execute(
+            """
+            SELECT * FROM transactions
+            WHERE date BETWEEN ? AND ?
+            ORDER BY date DESC
+            LIMIT ?
+            """,
+            (start_date, end_date, limit),
+        )
+        return [self._row_to_transaction(row) for row in cursor]
+
+    def _to_row(self, transaction: Transaction) -> tuple:
+        """Convert a Transaction to INSERT parameters."""
+        return (
+            transaction.date,
+            transaction.description,
+            str(transaction.amount), # Store as string for precision
+            transaction.type.value,
+            transaction.account,
+            transaction.category,
+            json.dumps(transaction.raw_data) if transaction.raw_data else None,
+        )
+
     def _row_to_transaction(self, row: sqlite3.Row) -> Transaction:
         """Convert database row to Transaction object."""
         return Transaction(
@@ -6,7 +6,7 @@ These models represent the results of service operations, not domain entities.
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from typing import List
+from typing import Dict, List, Tuple
 from expense_tracker.domain.models import Transaction
 
 @dataclass
@@ -16,16 +16,21 @@ class ImportResult:
     
     Provides detailed feedback about what happened during import:
     - How many transactions were processed
-    - Which ones were new vs duplicates
+    - How many were new vs duplicates
     - Any errors encountered
+
+    Only the first PREVIEW_SIZE transactions are kept (in `preview`, with
+    whether each one was new), so the result stays small however big the
+    statement is.
     """
+    PREVIEW_SIZE = 5
+
     total_parsed: int
     new_transactions: int
     duplicates_skipped: int
     errors: int = 0
 
-    imported: List[Transaction] = field(default_factory=List)
-    skipped: List[Transaction] = field(default_factory=List)
+    preview: List[Tuple[Transaction, bool]] = field(default_factory=list)
     error_messages: List[str] = field(default_factory=list)
 
     filepath: str = ""
@@ -40,6 +45,23 @@ class ImportResult:
     def partial_success(self) -> bool:
         """Some transactions imported but some failed"""
         return self.new_transactions > 0 and self.errors > 0
+
+    def record(self, transactions: List[Transaction], is_new: List[bool]) -> None:
+        """
+        Add a processed chunk of transactions to the counts and preview.
+
+        Args:
+            transactions: Parsed transactions, in statement order
+            is_new: Whether each transaction was new (True) or a duplicate
+        """
+        new_count = sum(is_new)
+        self.total_parsed += len(transactions)
+        self.new_transactions += new_count
+        self.duplicates_skipped += len(transactions) - new_count
+
+        room = self.PREVIEW_SIZE - len(self.preview)
+        if room > 0:
+            self.preview.extend(zip(transactions[:room], is_new[:room]))
     
     def __str__(self) -> str:
         "Human-readable summary"
@@ -56,16 +78,17 @@ class ImportResult:
         return "\n".join(lines)
     
     def __post_init__(self):
-        """Validate counts match lists"""
-        if self.new_transactions != len(self.imported):
+        """Validate counts are consistent"""
+        if self.new_transactions + self.duplicates_skipped > self.total_parsed:
             raise ValueError(
-                f"Count mismatch: new_transactions={self.new_transactions} "
-                f"but len(imported)={len(self.imported)}"
+                f"Count mismatch: new_transactions={self.new_transactions} and "
+                f"duplicates_skipped={self.duplicates_skipped} "
+                f"but total_parsed={self.total_parsed}"
             )
-        if self.duplicates_skipped != len(self.skipped):
+        if len(self.preview) > self.PREVIEW_SIZE:
             raise ValueError(
-                f"Count mismatch: duplicates_skipped={self.duplicates_skipped} "
-                f"but len(skipped)={len(self.skipped)}"
+                f"Preview holds {len(self.preview)} transactions, "
+                f"at most {self.PREVIEW_SIZE} allowed"
             )
 
 @dataclass
@@ -153,4 +176,58 @@ class MonthlySummary:
             for category, amount in self.top_spending_categories[:5]:
                 lines.append(f"  • {category}: ${amount:,.2f}")
         
-        return "\n".join(lines)
\ No newline at end of file
+        return "\n".join(lines)
+
+
+@dataclass
+class MonthlyReport:
+    """
+    Pre-aggregated view of a month for the report command.
+
+    Unlike MonthlySummary it doesn't hold every transaction of the month,
+    only the per-category totals and counts computed by the repository and
+    the few most recent transactions to display.
+    """
+
+    year: int
+    month: int
+
+    debits_by_category: Dict[str, Decimal] = field(default_factory=dict)
+    credits_by_category: Dict[str, Decimal] = field(default_factory=dict)
+    debit_count: int = 0
+    credit_count: int = 0
+    recent: List[Transaction] = field(default_factory=list)
+
+    @property
+    def start_date(self) -> date:
+        """First day of the month"""
+        return date(self.year, self.month, 1)
+
+    @property
+    def total_debits(self) -> Decimal:
+        """Total amount spent (outgoing)"""
+        return sum(self.debits_by_category.values(), Decimal(0))
+
+    @property
+    def total_credits(self) -> Decimal:
+        """Total amount received (incoming)"""
+        return sum(self.credits_by_category.values(), Decimal(0))
+
+    @property
+    def net_flow(self) -> Decimal:
+        """Net cash flow (credits - debits)"""
+        return self.total_credits - self.total_debits
+
+    @property
+    def total_transactions(self) -> int:
+        return self.debit_count + self.credit_count
+
+    @property
+    def top_spending_categories(self) -> List[tuple[str, Decimal]]:
+        """Categories sorted by spending amount (descending)"""
+        return sorted(
+            self.debits_by_category.items(),
+            key=lambda x: x[1],
+            reverse=True
+        )
+
@@ -1,14 +1,22 @@
+from collections import Counter
+from itertools import islice
 from pathlib import Path
-from typing import Optional, List
+from typing import Iterable, Iterator, Optional, List, Set, Tuple
 from datetime import date
 from calendar import monthrange
 from expense_tracker.parsers.factory import ParserFactory
 from expense_tracker.repositories.base import TransactionRepository
 from expense_tracker.domain.enums import TransactionType
 from expense_tracker.domain.models import Transaction
-from expense_tracker.services.models import ImportResult, MonthlySummary
+from expense_tracker.services.models import ImportResult, MonthlyReport, MonthlySummary
 from expense_tracker.categorization import CategorizationEngine
 
+def _chunks(items: Iterable[Transaction], size: int) -> Iterator[List[Transaction]]:
+    """Yield consecutive lists of up to `size` items"""
+    iterator = iter(items)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 class TransactionService:
 
     def __init__(
@@ -26,6 +34,10 @@ class TransactionService:
             self._categorization_engine = CategorizationEngine()
         return self._categorization_engine
 
+    # Parsed transactions are categorized, deduplicated and saved this many
+    # at a time
+    IMPORT_CHUNK_SIZE = 500
+
     def import_statement(
         self,
         filepath: Path,
@@ -35,6 +47,11 @@ class TransactionService:
     ) -> ImportResult:
         """
         Import transactions from a statement file
+
+        Transactions are processed in chunks of IMPORT_CHUNK_SIZE, each one
+        saved (committed) before the next is handled, and the result only
+        keeps counts and a short preview. Re-running an interrupted import
+        is safe since already saved transactions are skipped as duplicates.
         
         Args:
             filepath: The path to the statement file
@@ -46,45 +63,91 @@ class TransactionService:
             An ImportResult.
         """
         parser = ParserFactory.create_parser(financial_institution)
-        transactions = parser.parse(filepath)
-
-        if categorize:
-            transactions = self.categorization_engine.categorize_many(
-                transactions, 
-                overwrite=True
-            )
 
-        if dry_run:
-            # Check duplicates WITHOUT saving
-            new_transactions = []
-            skipped = []
-            for txn in transactions:
-                if self.repository.exists(
-                    date=txn.date,
-                    account=txn.account,
-                    description=txn.description,
-                    amount=float(txn.amount)
-                ):
-                    skipped.append(txn)
-                else:
-                    new_transactions.append(txn)
-        else:
-            new_transactions = self.repository.save_many(transactions)
-            
-            # Determining which were skipped
-            new_ids = {id(t) for t in new_transactions}
-            skipped = [t for t in transactions if id(t) not in new_ids]
-    
-        return ImportResult(
-            total_parsed=len(transactions),
-            new_transactions=len(new_transactions),
-            duplicates_skipped=len(skipped),
-            imported=new_transactions,
-            skipped=skipped,
-            filepath=str(filepath), 
+        result = ImportResult(
+            total_parsed=0,
+            new_transactions=0,
+            duplicates_skipped=0,
+            filepath=str(filepath),
             financial_institution=financial_institution,
         )
 
+        # Dedup keys of earlier chunks, so a dry run skips repeats within
+        # the statement the same way saving would
+        seen = set()
+        for chunk in _chunks(parser.parse(filepath), self.IMPORT_CHUNK_SIZE):
+            if categorize:
+                chunk = self.categorization_engine.categorize_many(
+                    chunk,
+                    overwrite=True
+                )
+
+            if dry_run:
+                # Check duplicates WITHOUT saving
+                is_new = self._flag_new(chunk, seen)
+            else:
+                is_new = self._flag_saved(chunk, self.repository.save_many(chunk))
+
+            result.record(chunk, is_new)
+
+        return result
+
+    def bulk_dedup(
+        self,
+        transactions: List[Transaction]
+    ) -> Tuple[List[Transaction], List[Transaction]]:
+        """
+        Split transactions into new ones and duplicates, without saving.
+
+        Stored duplicates are found with a single repository lookup, and
+        repeats within `transactions` count as duplicates too, the same
+        way save_many() would skip them.
+
+        Args:
+            transactions: Parsed transactions
+
+        Returns:
+            (new transactions, duplicates)
+        """
+        new_transactions = []
+        skipped = []
+        for txn, is_new in zip(transactions, self._flag_new(transactions, set())):
+            (new_transactions if is_new else skipped).append(txn)
+        return new_transactions, skipped
+
+    def _flag_new(self, transactions: List[Transaction], seen: Set[tuple]) -> List[bool]:
+        """
+        Flag which transactions are neither stored nor in `seen`.
+
+        Keys of the transactions are added to `seen` as they're checked.
+        """
+        existing = self.repository.find_existing(transactions)
+        flags = []
+        for txn in transactions:
+            key = txn.dedup_key
+            flags.append(key not in existing and key not in seen)
+            seen.add(key)
+        return flags
+
+    @staticmethod
+    def _flag_saved(transactions: List[Transaction], saved: List[Transaction]) -> List[bool]:
+        """
+        Flag which transactions save_many() stored.
+
+        save_many returns copies carrying their new ids, so they're matched
+        back to the parsed transactions by dedup key. Counting keys keeps
+        repeats within the statement right: the first is saved, the rest
+        are skipped.
+        """
+        remaining = Counter(t.dedup_key for t in saved)
+        flags = []
+        for txn in transactions:
+            key = txn.dedup_key
+            flags.append(remaining[key] > 0)
+            if remaining[key]:
+                remaining[key] -= 1
+        return flags
+
     def get_transactions(
         self,
         start_date: Optional[date] = None,
@@ -135,8 +198,8 @@ class TransactionService:
             end_date=end_date
         )
 
-        debits = [t for t in transactions if t.type == TransactionType.DEBIT]
-        credits = [t for t in transactions if t.type == TransactionType.CREDIT]
+        debits = [t for t in transactions if t.type is TransactionType.DEBIT]
+        credits = [t for t in transactions if t.type is TransactionType.CREDIT]
         
         return MonthlySummary(
             year=year,
@@ -145,6 +208,52 @@ class TransactionService:
             credits=credits,
         )
     
+    def get_monthly_report(
+        self,
+        year: int,
+        month: int,
+        recent_limit: int = 15,
+    ) -> MonthlyReport:
+        """
+        Get the aggregated report for a specific month.
+
+        Totals are computed by the repository, so only the per-category
+        rows and the `recent_limit` newest transactions are loaded instead
+        of the whole month.
+
+        Args:
+            year: Report year
+            month: Report month (1-12)
+            recent_limit: How many of the latest transactions to include
+
+        Returns:
+            A MonthlyReport
+        """
+        start_date = date(year, month, 1)
+        _, last_day = monthrange(year, month)
+        end_date = date(year, month, last_day)
+
+        report = MonthlyReport(year=year, month=month)
+        for txn_type, category, total, count in self.repository.get_category_totals(
+            start_date=start_date,
+            end_date=end_date
+        ):
+            if txn_type is TransactionType.DEBIT:
+                report.debits_by_category[category] = total
+                report.debit_count += count
+            else:
+                report.credits_by_category[category] = total
+                report.credit_count += count
+
+        if report.total_transactions:
+            report.recent = self.repository.get_recent(
+                start_date=start_date,
+                end_date=end_date,
+                limit=recent_limit
+            )
+
+        return report
+
     def categorize_transactions(
         self,
         start_date: Optional[date] = None,
@@ -109,4 +109,72 @@ class TestCIBCCostcoParserEdgeCases:
         
         for line in malformed:
             result = cibc_costco_parser._parse_charge_line(line)
-            assert result is None
\ No newline at end of file
+            assert result is None
+
+@pytest.fixture
+def generated_cibc_costco_pdf(tmp_path: Path) -> Path:
+    """Write a small two-page CIBC Costco style statement with columned rows"""
+    pymupdf = pytest.importorskip("pymupdf")
+
+    pdf = pymupdf.open()
+    summary = pdf.new_page()
+    for i, text in enumerate([
+        "CIBC Costco World Mastercard",
+        "Your account at a glance",
+        "Statement Date",
+        "December 20, 2025",
+    ]):
+        summary.insert_text((72, 72 + 16 * i), text)
+
+    rows = [
+        ("Your payments",),
+        ("Trans", "Post"),
+        ("date", "date", "Description", "Amount($)"),
+        ("Nov 27", "Nov 28", "PAYMENT THANK YOU/PAIEMENT MERCI", "2,933.53"),
+        ("Your new charges and credits",),
+        ("Card number 5268 XXXX XXXX 8577",),
+        ("Dec 10", "Dec 11", "ZEHRS KINSVILLE #572 KINGSVILLE ON", "Retail and Grocery", "87.15"),
+        ("Dec 17", "Dec 18", "WWW COSTCO CA OTTAWA ON", "Retail and Grocery", "-413.24"),
+    ]
+    page = pdf.new_page()
+    for i, row in enumerate(rows):
+        for x, text in zip((72, 130, 190, 400, 520), row):
+            page.insert_text((x, 72 + 14 * i), text, fontsize=9)
+
+    path = tmp_path / "statement.pdf"
+    pdf.save(path)
+    pdf.close()
+    return path
+
+@pytest.mark.integration
+@pytest.mark.cibcCostcoCreditCard 
+class TestCIBCCostcoParserTextBackends:
+    """Test PyMuPDF and pdfplumber extraction give the same transactions"""
+
+    def test_backends_agree(self, generated_cibc_costco_pdf: Path, monkeypatch):
+        from expense_tracker.parsers import cibc_costco_credit
+
+        # Act
+        with_pymupdf = CIBCCostcoCreditCardParser().parse(generated_cibc_costco_pdf)
+        monkeypatch.setattr(cibc_costco_credit, "pymupdf", None)
+        with_pdfplumber = CIBCCostcoCreditCardParser().parse(generated_cibc_costco_pdf)
+
+        # Assert
+        assert with_pymupdf == with_pdfplumber
+        assert [(t.amount, t.type) for t in with_pymupdf] == [
+            (Decimal("2933.53"), TransactionType.CREDIT),
+            (Decimal("87.15"), TransactionType.DEBIT),
+            (Decimal("413.24"), TransactionType.CREDIT),
+        ]
+
+    def test_parse_reads_pdf_once(self, generated_cibc_costco_pdf: Path, mocker):
+        # Arrange
+        parser = CIBCCostcoCreditCardParser()
+        read_spy = mocker.spy(parser, "_read_page_texts")
+
+        # Act
+        transactions = parser.parse(generated_cibc_costco_pdf)
+
+        # Assert
+        assert len(transactions) == 3
+        read_spy.assert_called_once()
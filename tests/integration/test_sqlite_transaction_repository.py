@@ -1,4 +1,5 @@
 import pytest
+from dataclasses import replace
 from pathlib import Path
 from datetime import date
 from decimal import Decimal
@@ -75,8 +76,7 @@ class TestSQLiteRepository:
 
         # Multi-Act
         for amount in test_amounts:
-            txn = sample_transaction
-            txn.amount = amount
+            txn = replace(sample_transaction, amount=amount)
 
             saved = repo.save(txn)
             retrieved = repo.get_by_id(saved.id)
@@ -288,13 +288,10 @@ class TestSQLiteRepository:
         original_category = saved.category
         
         # Act
-        saved.category = "Updated Category"
-        saved.notes = "Added notes"
-        updated = repo.update(saved)
+        updated = repo.update(replace(saved, category="Updated Category"))
         
         # Assert
         assert updated.category == "Updated Category"
-        assert updated.notes == "Added notes"
         
         # Verify in database
         retrieved = repo.get_by_id(saved.id)
@@ -334,10 +331,7 @@ class TestSQLiteRepository:
             )
             for i in range(1, 6)
         ]
-        saved = repo.save_many(txns)
-
-        for txn in saved:
-            txn.category = "Updated"
+        saved = [replace(txn, category="Updated") for txn in repo.save_many(txns)]
 
         # Act
         updated = repo.update_many(saved)
@@ -412,6 +406,23 @@ class TestSQLiteRepository:
         )
         assert exists is False
     
+    def test_find_existing_returns_stored_keys(self, repo: SQLiteTransactionRepository, sample_transaction: Transaction):
+        """Test find_existing() only reports candidates that are already stored."""
+        # Arrange
+        repo.save(sample_transaction)
+        new_txn = replace(sample_transaction, description="Something Else")
+        other_account = replace(sample_transaction, account="other")
+
+        # Act
+        existing = repo.find_existing([sample_transaction, new_txn, other_account])
+
+        # Assert
+        assert existing == {sample_transaction.dedup_key}
+
+    def test_find_existing_empty(self, repo: SQLiteTransactionRepository):
+        """Test find_existing() with no candidates."""
+        assert repo.find_existing([]) == set()
+
     def test_save_many_transactions(self, repo: SQLiteTransactionRepository):
         """Test bulk save operation."""
         # Arrange
@@ -460,7 +471,30 @@ class TestSQLiteRepository:
         # Assert - only txn2 should be saved
         assert len(saved) == 1
         assert saved[0].description == "Second"
-    
+
+    def test_save_many_assigns_ids_across_batches(self, repo: SQLiteTransactionRepository, monkeypatch):
+        """Test ids line up with stored rows when the insert spans several batches."""
+        # Arrange
+        monkeypatch.setattr(SQLiteTransactionRepository, "BATCH_SIZE", 2)
+        transactions = [
+            Transaction(
+                date=date(2025, 1, i),
+                description=f"Transaction {i}",
+                amount=Decimal(str(i * 10)),
+                type=TransactionType.DEBIT,
+                account="test",
+            )
+            for i in range(1, 6)
+        ]
+
+        # Act - the repeated transaction is dropped, not a UNIQUE violation
+        saved = repo.save_many(transactions + [transactions[0]])
+
+        # Assert
+        assert len(saved) == 5
+        for txn in saved:
+            assert repo.get_by_id(txn.id).description == txn.description
+
     def test_transactions_ordered_by_date_desc(self, repo: SQLiteTransactionRepository):
         """Test get_all returns newest transactions first."""
         # Arrange
@@ -489,4 +523,47 @@ class TestSQLiteRepository:
         assert txns[0].description == "New"
         assert txns[1].description == "Old"
 
-    
\ No newline at end of file
+
+@pytest.mark.integration
+class TestSQLiteRepositoryReport:
+    """Test the aggregate queries behind the monthly report"""
+
+    @pytest.fixture
+    def month_of_transactions(self, repo: SQLiteTransactionRepository):
+        rows = [
+            (date(2025, 1, 3), "Grocer A", "10.10", TransactionType.DEBIT, "Groceries"),
+            (date(2025, 1, 9), "Grocer B", "0.20", TransactionType.DEBIT, "Groceries"),
+            (date(2025, 1, 12), "Diner", "25.00", TransactionType.DEBIT, None),
+            (date(2025, 1, 20), "Payroll", "1000.00", TransactionType.CREDIT, "Income"),
+            (date(2025, 2, 1), "Next Month", "99.00", TransactionType.DEBIT, "Groceries"),
+        ]
+        repo.save_many([
+            Transaction(
+                date=txn_date,
+                description=description,
+                amount=Decimal(amount),
+                type=txn_type,
+                account="test",
+                category=category,
+            )
+            for txn_date, description, amount, txn_type, category in rows
+        ])
+
+    def test_get_category_totals(self, repo: SQLiteTransactionRepository, month_of_transactions):
+        # Act
+        totals = repo.get_category_totals(date(2025, 1, 1), date(2025, 1, 31))
+
+        # Assert
+        assert totals == [
+            (TransactionType.CREDIT, "Income", Decimal("1000.00"), 1),
+            (TransactionType.DEBIT, "Uncategorized", Decimal("25.00"), 1),
+            (TransactionType.DEBIT, "Groceries", Decimal("10.30"), 2),
+        ]
+
+    def test_get_recent(self, repo: SQLiteTransactionRepository, month_of_transactions):
+        # Act
+        recent = repo.get_recent(date(2025, 1, 1), date(2025, 1, 31), limit=2)
+
+        # Assert
+        assert [txn.description for txn in recent] == ["Payroll", "Diner"]
+
@@ -82,7 +82,145 @@ class TestAmexParserDebitRows:
         assert transaction.amount == Decimal('12.99')
         assert transaction.type == TransactionType.DEBIT
         assert transaction.account == 'amex'
-    
 
 
-    
\ No newline at end of file
+@pytest.mark.unit
+@pytest.mark.amex
+class TestAmexParserFrame:
+
+    def test_parse_frame_matches_row_parsing(self, amex_parser: AmexExcelParser):
+        """Test the column-wise parse gives the same transactions as _parse_row"""
+
+        # Arrange
+        df = pd.DataFrame({
+            'Date': ['11 Dec. 2025', '12 Dec. 2025', None, '13 Dec. 2025', '14 Dec. 2025'],
+            'Description': ['MEMBERSHIP FEE', pd.NA, 'NO DATE', 'LOBLAWS', pd.NA],
+            'Cardmember': ['JOHN SMITH', '-$24.55', 'JOHN SMITH', 'JOHN SMITH', '-$1,024.50'],
+            'Amount': ['$12.99', None, '$1.00', '$1,234.50', None],
+            'Merchant Address': [None, 'AMZN MKTP CA', None, None, None],
+            'Additional Information': ['MEMBERSHIP FEE', None, None, None, 'REFUND'],
+        })
+        expected = [
+            amex_parser._parse_row(row)
+            for _, row in df.iterrows()
+            if amex_parser._valid_row(row)
+        ]
+
+        # Act
+        transactions = amex_parser._parse_frame(df)
+
+        # Assert
+        assert transactions == expected
+        assert [t.type for t in transactions] == [
+            TransactionType.DEBIT,
+            TransactionType.CREDIT,
+            TransactionType.DEBIT,
+            TransactionType.CREDIT,
+        ]
+        assert transactions[3].description == 'REFUND'
+        assert transactions[3].amount == Decimal('1024.50')
+
+
+    def test_parse_dates_detects_format_and_falls_back(self, amex_parser: AmexExcelParser):
+        """Test dates use the detected format, with odd cells still parsed"""
+
+        # Arrange
+        values = pd.Series(
+            ['11 Dec. 2025', datetime(2025, 1, 2), None, '5 Sept. 2025', 'not a date'],
+            dtype=object
+        )
+
+        # Act
+        dates = amex_parser._parse_dates(values)
+
+        # Assert
+        assert amex_parser._detect_date_format(values) == '%d %b. %Y'
+        assert dates.tolist()[:2] == [pd.Timestamp(2025, 12, 11), pd.Timestamp(2025, 1, 2)]
+        assert dates.tolist()[3] == pd.Timestamp(2025, 9, 5)
+        assert dates.isna().tolist() == [False, False, True, False, True]
+
+    def test_parse_cents_large_statement_matches_small(self, amex_parser: AmexExcelParser, monkeypatch):
+        """Test statements big enough for the compiled parse agree with the pandas parse"""
+
+        # Arrange
+        from expense_tracker.parsers import amex_excel
+        values = pd.Series(
+            ["$1,234.50", "-$24.55", "12.99", "$0.5", " $7 ", "nan", "-&$3.00", "1e-05"] * 100
+        )
+
+        # Act
+        large = amex_parser._parse_cents(values)
+        monkeypatch.setattr(amex_excel, "_NUMBA_THRESHOLD", len(values) + 1)
+        small = amex_parser._parse_cents(values)
+
+        # Assert
+        assert large[:8].tolist()[:5] == [123450, -2455, 1299, 50, 700]
+        assert large.isna().tolist() == small.isna().tolist()
+        assert large.fillna(-1).tolist() == small.fillna(-1).tolist()
+
+@pytest.fixture
+def generated_amex_xlsx(tmp_path: Path) -> Path:
+    """Write a small Amex-style .xlsx statement"""
+    import openpyxl
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["American Express"])
+    sheet.append(["Transaction Details"])
+    sheet.append(["Date", "Date Processed", "Description", "Cardmember", "Amount", "Merchant Address"])
+    sheet.append([datetime(2025, 12, 11), datetime(2025, 12, 11), "LOBLAWS", "JOHN SMITH", "$1,234.50", None])
+    sheet.append([datetime(2025, 12, 12), datetime(2025, 12, 12), None, "-$24.55", None, "AMZN MKTP CA"])
+
+    path = tmp_path / "statement.xlsx"
+    workbook.save(path)
+    return path
+
+@pytest.mark.unit
+@pytest.mark.amex
+class TestAmexParserReading:
+
+    def test_parse_reads_file_once(self, amex_parser: AmexExcelParser, generated_amex_xlsx: Path, mocker):
+        """Test validate_file and parse share a single read of the workbook"""
+
+        # Arrange
+        read_rows = mocker.spy(amex_parser, "_read_rows")
+
+        # Act
+        transactions = amex_parser.parse(generated_amex_xlsx)
+
+        # Assert
+        assert read_rows.call_count == 1
+        assert [(t.description, t.amount, t.type) for t in transactions] == [
+            ("LOBLAWS", Decimal("1234.50"), TransactionType.DEBIT),
+            ("AMZN MKTP CA", Decimal("24.55"), TransactionType.CREDIT),
+        ]
+        assert transactions[0].date == datetime(2025, 12, 11).date()
+
+
+    @pytest.mark.parametrize("header", [
+        ("Date", "Description", "Amount"),
+        ("AMOUNT", "description", "Transaction date"),
+    ])
+    def test_find_header_row_any_order_and_case(self, amex_parser: AmexExcelParser, header):
+        """Test the header row is found regardless of column order and case"""
+
+        # Arrange
+        rows = [("American Express",), (None, None), header, ("2025-12-11", "LOBLAWS", "$1.00")]
+
+        # Act
+        result = amex_parser._find_header_row(rows)
+
+        # Assert
+        assert result == 2
+
+    def test_find_header_row_only_scans_top_rows(self, amex_parser: AmexExcelParser):
+        """Test a header below HEADER_SCAN_ROWS is not picked up"""
+
+        # Arrange
+        rows = [("filler",)] * amex_parser.HEADER_SCAN_ROWS + [("Date", "Description", "Amount")]
+
+        # Act
+        result = amex_parser._find_header_row(rows)
+
+        # Assert
+        assert result is None
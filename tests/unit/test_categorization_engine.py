@@ -5,6 +5,12 @@ from decimal import Decimal
 from expense_tracker.domain.enums import TransactionType
 from expense_tracker.domain.models import Transaction
 from expense_tracker.categorization.categorizer import CategorizationEngine
+from expense_tracker.categorization.rules import (
+    DefaultRule,
+    KeywordRule,
+    RegexRule,
+    UserDefinedRule
+)
 
 @pytest.fixture
 def sample_transaction():
@@ -52,6 +58,24 @@ class TestCategorizationEngineConfig:
         assert category is not None
         assert isinstance(category, str)
 
+    def test_config_loaded_on_first_use(self, mocker, sample_transaction: Transaction):
+        """Test the engine doesn't read config until it categorizes"""
+        # Arrange
+        load_rules = mocker.patch(
+            "expense_tracker.categorization.categorizer.ConfigLoader.load_rules_config",
+            return_value={"rules": []}
+        )
+
+        # Act
+        engine = CategorizationEngine()
+        loaded_at_init = load_rules.called
+        engine.categorize(sample_transaction)
+        engine.categorize(sample_transaction)
+
+        # Assert
+        assert not loaded_at_init
+        load_rules.assert_called_once()
+
     def test_user_rules_override_builtin(self, sample_transaction: Transaction):
         """Test that user config has highest priority."""
 
@@ -182,6 +206,20 @@ class TestCategorizationEngineChain:
         assert "UserDefinedRule" in info
         assert "DefaultRule" in info
 
+    def test_set_next_returns_rule_for_chaining(self, sample_transaction: Transaction):
+        """Test rules can be chained fluently with set_next."""
+        # Arrange
+        first = KeywordRule({"Dining": ["tim hortons"]})
+        second = KeywordRule({"Groceries": ["loblaws"]})
+        default = DefaultRule()
+
+        # Act
+        returned = first.set_next(second).set_next(default)
+
+        # Assert
+        assert returned is default
+        assert first.categorize(sample_transaction) == "Groceries"
+
     def test_categorize_many(self):
         """Test batch categorization"""
         # Act
@@ -226,6 +264,36 @@ class TestCategorizationEngineChain:
         assert categorized[1].category == "Gas"
         assert categorized[2].category == "Uncategorized"
 
+    def test_categorize_many_agrees_with_categorize(self):
+        """Test batch categorization picks the same categories as one-by-one"""
+        # Arrange
+        config = {
+            "rules": [
+                {"category": "Refunds", "type": "keyword", "transaction_type": "Credit", "patterns": ["amazon"]},
+                {"category": "Groceries", "type": "keyword", "patterns": ["loblaws", "metro"]},
+                {"category": "Shopping", "type": "regex", "patterns": [r"^AMZN", r"amazon\.ca"]},
+            ]
+        }
+        descriptions = ["LOBLAWS", "AMZN MKTP", "Amazon.ca", "METRO 123", "SHELL"]
+        transactions = [
+            Transaction(
+                date=date(2026, 1, 1),
+                description=description,
+                amount=Decimal("9.99"),
+                account="amex",
+                type=txn_type
+            )
+            for description in descriptions
+            for txn_type in (TransactionType.DEBIT, TransactionType.CREDIT)
+        ]
+        engine = CategorizationEngine(config=config, use_defaults=False)
+
+        # Act
+        categorized = engine.categorize_many(transactions)
+
+        # Assert
+        assert [t.category for t in categorized] == [engine.categorize(t) for t in transactions]
+
     def test_engine_respects_overwrite_flag(self):
         """Test the overwrite flag is being respected"""
 
@@ -311,3 +379,165 @@ class TestCategorizationEngineChain:
         # Act & Assert
         assert engine.categorize(debit) == "Shopping"
         assert engine.categorize(credit) == "Refunds"
+
+
+@pytest.mark.unit
+class TestKeywordRule:
+    """Test keyword matching"""
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    def test_first_category_wins_on_overlapping_keywords(
+        self,
+        sample_transaction: Transaction,
+        use_automaton: bool
+    ):
+        """Test category order decides the match, not keyword position"""
+        # Arrange
+        rule = KeywordRule({
+            "Groceries": ["ottawa"],
+            "Shopping": ["loblaws"],
+        })
+        if not use_automaton:
+            rule._automaton = None
+
+        # Act
+        category = rule.categorize(sample_transaction)
+
+        # Assert
+        assert category == "Groceries"
+
+    @pytest.mark.parametrize("use_automaton", [True, False])
+    @pytest.mark.parametrize("description", ["PETRO-CANADA #1234", "PETRO*CANADA 1234"])
+    def test_punctuation_is_ignored(
+        self,
+        sample_transaction: Transaction,
+        use_automaton: bool,
+        description: str
+    ):
+        """Test keywords match regardless of separators like - or *"""
+        # Arrange
+        rule = KeywordRule({"Gas": ["petro-canada"]})
+        if not use_automaton:
+            rule._automaton = None
+        transaction = Transaction(
+            date=sample_transaction.date,
+            description=description,
+            amount=sample_transaction.amount,
+            type=sample_transaction.type,
+            account=sample_transaction.account,
+        )
+
+        # Act
+        category = rule.categorize(transaction)
+        batch = rule._try_many([transaction])
+
+        # Assert
+        assert category == "Gas"
+        assert batch == ["Gas"]
+
+
+    def test_large_batch_matches_single_categorization(self, sample_transaction: Transaction):
+        """Test batches big enough for the compiled scan agree with _try"""
+        # Arrange
+        rule = KeywordRule({
+            "Groceries": ["ottawa"],
+            "Shopping": ["loblaws", "café"],
+        }, TransactionType.DEBIT)
+        descriptions = ["LOBLAWS OTTAWA", "LOBLAWS", "CAFÉ CRÈME", "SHELL"]
+        transactions = [
+            Transaction(
+                date=sample_transaction.date,
+                description=descriptions[i % len(descriptions)],
+                amount=sample_transaction.amount,
+                type=TransactionType.DEBIT if i % 3 else TransactionType.CREDIT,
+                account=sample_transaction.account,
+            )
+            for i in range(600)
+        ]
+
+        # Act
+        categories = rule._try_many(transactions)
+
+        # Assert
+        assert categories == [rule._try(t) for t in transactions]
+
+
+@pytest.mark.unit
+class TestRegexRule:
+    """Test regex matching"""
+
+    @pytest.mark.parametrize("matcher", ["re2", "combined", "loop"])
+    def test_first_category_wins_on_overlapping_patterns(
+        self,
+        sample_transaction: Transaction,
+        matcher: str
+    ):
+        """Test category order decides the match, not pattern position"""
+        # Arrange
+        rule = RegexRule({
+            "Groceries": [r"OTT\w+$"],
+            "Shopping": [r"^LOB"],
+        })
+        if matcher == "re2" and rule._pattern_set is None:
+            pytest.skip("google-re2 not installed")
+        if matcher != "re2":
+            rule._pattern_set = None
+        if matcher == "loop":
+            rule._combined = None
+
+        # Act
+        category = rule.categorize(sample_transaction)
+
+        # Assert
+        assert category == "Groceries"
+
+    def test_patterns_with_backreferences_still_match(self, sample_transaction: Transaction):
+        """Test patterns that can't be merged fall back to one search each"""
+        # Arrange
+        rule = RegexRule({"Groceries": [r"(L)OB\1AWS"]})
+
+        # Act
+        category = rule.categorize(sample_transaction)
+
+        # Assert
+        assert rule._combined is None
+        assert rule._pattern_set is None
+        assert category == "Groceries"
+
+
+@pytest.mark.unit
+class TestUserDefinedRule:
+    """Test merged user-defined rules"""
+
+    def test_config_order_wins_with_repeated_category(self):
+        """Test a repeated category keeps each rule's own position"""
+        # Arrange
+        rule = UserDefinedRule([
+            {"category": "Groceries", "type": "keyword", "patterns": ["loblaws"],
+             "transaction_type": "Credit"},
+            {"category": "Shopping", "type": "keyword", "patterns": ["ottawa"]},
+            {"category": "Groceries", "type": "keyword", "patterns": ["lob"]},
+            {"category": "Refunds", "type": "regex", "patterns": ["^LOB"]},
+        ])
+        debit = Transaction(
+            date=date(2025, 1, 15),
+            description="LOBLAWS OTTAWA",
+            amount=Decimal("45.67"),
+            type=TransactionType.DEBIT,
+            account="amex"
+        )
+        credit = Transaction(
+            date=date(2025, 1, 15),
+            description="LOBLAWS OTTAWA",
+            amount=Decimal("45.67"),
+            type=TransactionType.CREDIT,
+            account="amex"
+        )
+
+        # Act
+        categories = [rule.categorize(debit), rule.categorize(credit)]
+        batch = rule._try_many([debit, credit])
+
+        # Assert
+        assert categories == ["Shopping", "Groceries"]
+        assert batch == categories
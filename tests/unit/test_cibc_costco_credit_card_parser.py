@@ -204,4 +204,63 @@ class TestCIBCCostcoParserChargeLines:
         
         assert txn is not None
         assert txn.type == TransactionType.CREDIT
-        assert txn.amount == Decimal("413.24")  # Should be positive
\ No newline at end of file
+        assert txn.amount == Decimal("413.24")  # Should be positive
+
+@pytest.mark.unit
+@pytest.mark.cibcCostcoCreditCard 
+class TestCIBCCostcoParserPageText:
+    """Test the per-page section state machine"""
+
+    def test_parse_page_text_tracks_sections_and_card(self, cibc_costco_parser: CIBCCostcoCreditCardParser):
+        """Test lines are classified once and parsed by the section they're in"""
+        cibc_costco_parser.statement_year = 2025
+
+        text = "\n".join([
+            "Nov 27 Nov 28 BEFORE ANY SECTION 1.00",
+            "Your payments",
+            "Trans Post",
+            "Nov 27 Nov 28 PAYMENT THANK YOU/PAIEMENT MERCI 2,933.53",
+            "Total payments 2,933.53",
+            "Your new charges and credits",
+            "Card number 5268 XXXX XXXX 8577",
+            "Ý",
+            "Ý Dec 07 Dec 08 DALDONGNAE 9 MISSISSAUGA ON Restaurants 102.15",
+            "Page 2 of 3",
+            "Dec 17 Dec 18 WWW COSTCO CA OTTAWA ON Retail and Grocery -413.24",
+            "Total for 5268 XXXX XXXX 8577 -311.09",
+            "Dec 10 Dec 11 AFTER SECTION END 1.00",
+        ])
+
+        transactions = cibc_costco_parser._parse_page_text(text)
+
+        assert [(t.amount, t.type) for t in transactions] == [
+            (Decimal("2933.53"), TransactionType.CREDIT),
+            (Decimal("102.15"), TransactionType.DEBIT),
+            (Decimal("413.24"), TransactionType.CREDIT),
+        ]
+        assert "DALDONGNAE 9" in transactions[1].description
+        assert cibc_costco_parser.current_card_number == "5268 XXXX XXXX 8577"
+
+    def test_parse_pages_in_process_pool_matches_sequential(self):
+        """Test pooled page parsing keeps page order and the carried card number"""
+        pages = [
+            "\n".join([
+                "Your new charges and credits",
+                f"Card number 5268 XXXX XXXX {1000 + i}",
+                f"Dec {i + 1:02d} Dec {i + 2:02d} STORE {i} OTTAWA ON Retail and Grocery {i + 1}.25",
+            ])
+            for i in range(CIBCCostcoCreditCardParser.PARALLEL_PAGE_THRESHOLD)
+        ]
+        sequential = CIBCCostcoCreditCardParser()
+        sequential.statement_year = 2025
+        pooled = CIBCCostcoCreditCardParser()
+        pooled.statement_year = 2025
+
+        expected = [sequential._parse_page_text(text) for text in pages]
+        result = pooled._parse_pages(pages)
+
+        assert result == expected
+        assert [t.amount for page in result for t in page] == [
+            Decimal(f"{i + 1}.25") for i in range(len(pages))
+        ]
+        assert pooled.current_card_number == sequential.current_card_number
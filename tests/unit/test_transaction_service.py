@@ -7,7 +7,7 @@ from pathlib import Path
 from expense_tracker.domain.models import Transaction
 from expense_tracker.domain.enums import TransactionType
 from expense_tracker.services.transaction_service import TransactionService
-from expense_tracker.services.models import ImportResult, MonthlySummary
+from expense_tracker.services.models import ImportResult, MonthlyReport, MonthlySummary
 from expense_tracker.repositories.base import TransactionRepository
 
 @pytest.fixture
@@ -120,7 +120,7 @@ class TestTransactionServiceImport:
             'expense_tracker.parsers.factory.ParserFactory.create_parser',
             return_value=mock_parser
         )
-        mock_repository.exists.return_value = False
+        mock_repository.find_existing.return_value = set()
 
         filepath = Path('sample_statement.xls')
         financial_institution='amex'    
@@ -137,13 +137,13 @@ class TestTransactionServiceImport:
         ParserFactory.create_parser.assert_called_once_with(financial_institution)
 
         mock_parser.parse.assert_called_once_with(filepath)
-        mock_repository.exists.assert_called()
+        mock_repository.find_existing.assert_called_once_with(sample_transactions)
         mock_repository.save_many.assert_not_called()
         assert result.total_parsed == 2
         assert result.errors == 0
         assert result.duplicates_skipped == 0
         assert result.new_transactions == 2
-        assert result.imported == sample_transactions
+        assert result.preview == [(txn, True) for txn in sample_transactions]
         assert result.filepath == str(filepath)
         assert result.financial_institution == financial_institution
 
@@ -189,7 +189,7 @@ class TestTransactionServiceImport:
         assert result.errors == 0
         assert result.duplicates_skipped == 0
         assert result.new_transactions == 2
-        assert result.imported == sample_transactions
+        assert result.preview == [(txn, True) for txn in sample_transactions]
         assert result.filepath == str(filepath)
         assert result.financial_institution == financial_institution
 
@@ -235,11 +235,83 @@ class TestTransactionServiceImport:
         assert result.errors == 0
         assert result.duplicates_skipped == 1
         assert result.new_transactions == 1
-        assert result.imported == [sample_transactions[0]]
-        assert result.skipped == [sample_transactions[1]]
+        assert result.preview == [(sample_transactions[0], True), (sample_transactions[1], False)]
         assert result.filepath == str(filepath)
         assert result.financial_institution == financial_institution
 
+    def test_import_statement_processes_in_chunks(
+            self,
+            service: TransactionService,
+            mock_repository: TransactionRepository,
+            sample_transactions: List[Transaction],
+            mocker
+    ):
+        """Test large statements are saved chunk by chunk and only a preview is kept"""
+
+        # Arrange
+        transactions = [
+            Transaction(
+                date=date(2025, 1, 1),
+                description=f"Purchase {i}",
+                amount=Decimal("1.00"),
+                type=TransactionType.DEBIT,
+                account="amex",
+            )
+            for i in range(7)
+        ]
+        mock_parser = mocker.Mock()
+        mock_parser.parse.return_value = iter(transactions)
+        mocker.patch(
+            'expense_tracker.parsers.factory.ParserFactory.create_parser',
+            return_value=mock_parser
+        )
+        # Every chunk's first transaction is a duplicate
+        mock_repository.save_many.side_effect = lambda chunk: chunk[1:]
+        service.IMPORT_CHUNK_SIZE = 3
+
+        # Act
+        result = service.import_statement(filepath=Path('statement.xlsx'), financial_institution='amex')
+
+        # Assert
+        assert [call.args[0] for call in mock_repository.save_many.call_args_list] == [
+            transactions[0:3], transactions[3:6], transactions[6:7]
+        ]
+        assert result.total_parsed == 7
+        assert result.new_transactions == 4
+        assert result.duplicates_skipped == 3
+        assert [is_new for _, is_new in result.preview] == [False, True, True, False, True]
+
+    def test_import_dry_run_skips_repeats_across_chunks(
+            self,
+            service: TransactionService,
+            mock_repository: TransactionRepository,
+            sample_transactions: List[Transaction],
+            mocker
+    ):
+        """Test a dry run treats a repeat in a later chunk as a duplicate"""
+
+        # Arrange
+        mock_parser = mocker.Mock()
+        mock_parser.parse.return_value = sample_transactions + [sample_transactions[0]]
+        mocker.patch(
+            'expense_tracker.parsers.factory.ParserFactory.create_parser',
+            return_value=mock_parser
+        )
+        mock_repository.find_existing.return_value = set()
+        service.IMPORT_CHUNK_SIZE = 2
+
+        # Act
+        result = service.import_statement(
+            filepath=Path('statement.xlsx'),
+            financial_institution='amex',
+            dry_run=True
+        )
+
+        # Assert
+        assert result.new_transactions == 2
+        assert result.duplicates_skipped == 1
+        assert result.preview[-1] == (sample_transactions[0], False)
+
 @pytest.mark.unit
 class TestTransactionServiceMonthlySummary:
 
@@ -296,3 +368,61 @@ class TestTransactionServiceMonthlySummary:
                 start_date=date(2024, 2, 1),
                 end_date=date(2024, 2, 29),
             )
+
+
+@pytest.mark.unit
+class TestTransactionServiceMonthlyReport:
+    """Test the aggregated monthly report"""
+
+    def test_get_monthly_report_uses_repository_totals(
+            self,
+            service: TransactionService,
+            mock_repository: TransactionRepository,
+            sample_transactions: List[Transaction]
+    ):
+        # Arrange
+        mock_repository.get_category_totals.return_value = [
+            (TransactionType.CREDIT, "Income", Decimal("5000.00"), 1),
+            (TransactionType.DEBIT, "Dining", Decimal("4.50"), 1),
+            (TransactionType.DEBIT, "Groceries", Decimal("3.25"), 2),
+        ]
+        mock_repository.get_recent.return_value = sample_transactions
+
+        # Act
+        result: MonthlyReport = service.get_monthly_report(year=2025, month=1)
+
+        # Assert
+        mock_repository.get_category_totals.assert_called_once_with(
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31)
+        )
+        mock_repository.get_recent.assert_called_once_with(
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+            limit=15
+        )
+        mock_repository.get_all.assert_not_called()
+
+        assert result.debits_by_category == {"Dining": Decimal("4.50"), "Groceries": Decimal("3.25")}
+        assert result.credits_by_category == {"Income": Decimal("5000.00")}
+        assert result.total_transactions == 4
+        assert result.total_debits == Decimal("7.75")
+        assert result.net_flow == Decimal("4992.25")
+        assert result.recent == sample_transactions
+
+    def test_get_monthly_report_empty_month_skips_recent(
+            self,
+            service: TransactionService,
+            mock_repository: TransactionRepository,
+    ):
+        # Arrange
+        mock_repository.get_category_totals.return_value = []
+
+        # Act
+        result = service.get_monthly_report(year=2024, month=2)
+
+        # Assert
+        assert result.total_transactions == 0
+        assert result.total_debits == Decimal("0")
+        mock_repository.get_recent.assert_not_called()
+